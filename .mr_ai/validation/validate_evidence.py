@@ -5,14 +5,50 @@ Enforces evidence-based validation for all agent responses
 """
 
 import json
+import os
 import re
 import sys
+from collections import OrderedDict
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Dict, Tuple
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs keyed by path, validated against (mtime, size); LRU-evicted
+_CONFIG_CACHE: "OrderedDict[str, Tuple[float, int, Dict]]" = OrderedDict()
+_CONFIG_CACHE_MAX = 32
+
+# External validation: curl against anything other than localhost
+_EXTERNAL_RE = re.compile(r"curl.*http[^s]?://(?!localhost|127\.0\.0\.1)", re.IGNORECASE)
+
+# Any mention of a loopback target
+_LOCALHOST_RE = re.compile(r"localhost|127\.0\.0\.1", re.IGNORECASE)
+
+_RAW_OUTPUT_MARKER = "RAW OUTPUT:"
+
+
+def _has_at_least(content: str, char: str, n: int) -> bool:
+    """True once `char` has been seen `n` times (stops scanning early, unlike str.count)"""
+    pos = -1
+    for _ in range(n):
+        pos = content.find(char, pos + 1)
+        if pos == -1:
+            return False
+    return True
+
+
+def _stripped_length(content: str, start: int) -> int:
+    """len(content[start:].strip()) without copying the tail of the file"""
+    end = len(content)
+    while start < end and content[start].isspace():
+        start += 1
+    while end > start and content[end - 1].isspace():
+        end -= 1
+    return end - start
+
 
 class EvidenceValidator:
     """Validates agent evidence blocks against Mr. AI standards"""
@@ -25,6 +61,12 @@ class EvidenceValidator:
         "stability_check": r"[3-9]/[3-9] successful|3 (identical|successful)",
     }
 
+    # Compiled once at class creation so validation skips the re cache lookup
+    _COMPILED_REQUIRED = {
+        name: re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+        for name, pattern in REQUIRED_PATTERNS.items()
+    }
+
     # Forbidden phrases (success theater)
     FORBIDDEN_PHRASES = [
         "should be working",
@@ -39,6 +81,9 @@ class EvidenceValidator:
         "appears correct",
     ]
 
+    # Single alternation so all phrases are found in one pass over the content
+    _FORBIDDEN_RE = re.compile("|".join(re.escape(p) for p in FORBIDDEN_PHRASES), re.IGNORECASE)
+
     def __init__(self, config_path=".mr_ai/config.yaml"):
         self.errors = []
         self.warnings = []
@@ -46,19 +91,36 @@ class EvidenceValidator:
         self.config = self._load_config(config_path)
 
     def _load_config(self, config_path):
-        """Load framework configuration"""
+        """Load framework configuration (cached until the file changes)"""
         try:
-            if Path(config_path).exists():
-                with open(config_path, "r") as f:
-                    return yaml.safe_load(f)
+            st = os.stat(config_path)
+        except OSError:
+            return {}
+
+        key = os.path.abspath(config_path)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+            _CONFIG_CACHE.move_to_end(key)
+            return cached[2]
+
+        try:
+            with open(config_path, "r") as f:
+                config = yaml.load(f, Loader=_YAML_LOADER)
         except Exception:
-            pass
-        return {}
+            return {}
+
+        _CONFIG_CACHE[key] = (st.st_mtime, st.st_size, config)
+        _CONFIG_CACHE.move_to_end(key)
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.popitem(last=False)
+        return config
 
     def validate_file(self, filepath: str) -> Tuple[bool, Dict]:
         """Validate an evidence file"""
         try:
-            content = Path(filepath).read_text()
+            # Read raw bytes in one unbuffered call and decode once
+            with open(filepath, "rb", buffering=0) as f:
+                content = f.read().decode("utf-8")
             return self.validate_content(content)
         except Exception as e:
             self.errors.append(f"Failed to read file: {e}")
@@ -71,8 +133,8 @@ class EvidenceValidator:
         self.score = 100
 
         # Check for required patterns
-        for pattern_name, pattern in self.REQUIRED_PATTERNS.items():
-            if not re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
+        for pattern_name, pattern in self._COMPILED_REQUIRED.items():
+            if not pattern.search(content):
                 self.errors.append(f"Missing required: {pattern_name}")
                 self.score -= 20
 
@@ -81,29 +143,28 @@ class EvidenceValidator:
 
         if not allow_localhost:
             # Require external IP validation
-            external_pattern = r"curl.*http[^s]?://(?!localhost|127\.0\.0\.1)"
-            if not re.search(external_pattern, content, re.IGNORECASE):
-                if "localhost" in content.lower() or "127.0.0.1" in content:
+            if not _EXTERNAL_RE.search(content):
+                if _LOCALHOST_RE.search(content):
                     self.errors.append("Only localhost testing - no external validation")
                     self.score -= 30
 
         # Check for forbidden phrases
-        content_lower = content.lower()
+        found = {m.group(0).lower() for m in self._FORBIDDEN_RE.finditer(content)}
         for phrase in self.FORBIDDEN_PHRASES:
-            if phrase in content_lower:
+            if phrase in found:
                 self.errors.append(f"Success theater detected: '{phrase}'")
                 self.score -= 25
 
         # Check for actual command output
-        if content.count("$") < 3 and content.count("#") < 3:
+        if not (_has_at_least(content, "$", 3) or _has_at_least(content, "#", 3)):
             self.warnings.append("Insufficient command examples")
             self.score -= 10
 
         # Check for output length (evidence should be substantial)
-        raw_output_match = re.search(r"RAW OUTPUT:(.*)", content, re.DOTALL)
-        if raw_output_match:
-            raw_output = raw_output_match.group(1)
-            if len(raw_output.strip()) < 100:
+        raw_output_start = content.find(_RAW_OUTPUT_MARKER)
+        if raw_output_start != -1:
+            raw_output_start += len(_RAW_OUTPUT_MARKER)
+            if _stripped_length(content, raw_output_start) < 100:
                 self.errors.append("Raw output too short - likely summarized")
                 self.score -= 30
         else:
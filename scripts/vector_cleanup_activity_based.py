@@ -17,11 +17,21 @@ Created: 2025-11-21
 """
 
 import asyncio
+import importlib
 import json
 import logging
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import IO, Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+try:
+    # Optional: Rust JSON codec, much faster on 10K-entry agent dumps
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logging (use local directory if /var/log not writable)
 log_dir = Path(__file__).parent.parent / "logs"
@@ -44,23 +54,143 @@ TIER_TTL_DAYS = {
 }
 
 
+def _json_loads(raw: Any) -> Any:
+    """Parse JSON from str or bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps_line(obj: Any) -> bytes:
+    """Serialize to one compact NDJSON line (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj).encode() + b"\n"
+
+
+def _json_dumps_pretty(obj: Any) -> str:
+    """Serialize to 2-space indented JSON (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+@dataclass
+class VectorMemoryColumns:
+    """
+    Vector memories for one agent stored as parallel columns.
+
+    The decay scan only reads tiers and created_days; the remaining columns
+    are touched only for memories that are actually deleted. Only a 100-char
+    content preview is kept - the audit log never needs the full content.
+    """
+
+    ids: List[str] = field(default_factory=list)
+    created_at: List[datetime] = field(default_factory=list)
+    created_days: List[int] = field(default_factory=list)  # date ordinals
+    tiers: List[str] = field(default_factory=list)
+    sizes: List[int] = field(default_factory=list)
+    content_previews: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(
+        self, memory_id: str, created_at: datetime, tier: str, size_bytes: int, content: str
+    ) -> None:
+        """Append one memory across all columns"""
+        self.ids.append(memory_id)
+        self.created_at.append(created_at)
+        self.created_days.append(created_at.toordinal())
+        self.tiers.append(tier)
+        self.sizes.append(size_bytes)
+        self.content_previews.append(content[:100] if content else "")
+
+    def row(self, index: int) -> Dict:
+        """Materialize one memory as a dict (id, created_at, tier, size_bytes, content_preview)"""
+        return {
+            "id": self.ids[index],
+            "created_at": self.created_at[index],
+            "tier": self.tiers[index],
+            "size_bytes": self.sizes[index],
+            "content_preview": self.content_previews[index],
+        }
+
+
+def compute_decay_mask(
+    created_days: List[int], tiers: List[str], sorted_days: List[int]
+) -> List[Tuple[int, int, int]]:
+    """
+    Find the memories whose active age exceeds their tier TTL, in one pass.
+
+    Tier 0 (ttl None) never decays and skips the active-age search entirely.
+
+    Args:
+        created_days: Creation date ordinal per memory
+        tiers: Tier name per memory
+        sorted_days: Ascending list of date ordinals with agent activity
+
+    Returns:
+        (index, tier_ttl, active_age) for every memory to delete, in column order
+    """
+    active_total = len(sorted_days)
+    ttl_for = TIER_TTL_DAYS.get
+    mask = []
+    for i, (created_day, tier) in enumerate(zip(created_days, tiers)):
+        ttl = ttl_for(tier)
+        if ttl is None:
+            continue
+        active_age = active_total - bisect_left(sorted_days, created_day)
+        if active_age > ttl:
+            mask.append((i, ttl, active_age))
+    return mask
+
+
+def _import_mcp_tool(module_name: str, tool_name: str) -> Optional[Callable]:
+    """Import an MCP tool function, or None when MCP is not available"""
+    try:
+        return getattr(importlib.import_module(module_name), tool_name)
+    except (ImportError, AttributeError):
+        return None
+
+
 class VectorCleanupService:
     """
     Activity-based vector cleanup service.
     Tracks active days (days with Memory Keeper entries) for decay calculation.
     """
 
-    def __init__(self, dry_run: bool = False):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        max_concurrency: int = 16,
+        audit_path: Optional[str] = None,
+        audit_tail: int = 100,
+    ):
         """
         Initialize cleanup service.
 
         Args:
             dry_run: If True, log what would be deleted without actually deleting
+            max_concurrency: Maximum number of agents cleaned up at the same time
+            audit_path: NDJSON audit log path (default: logs/vector_cleanup_audit.ndjson)
+            audit_tail: Number of most recent deletion records kept in memory
         """
         self.dry_run = dry_run
+        self.max_concurrency = max_concurrency
         self.deletion_count = 0
         self.storage_saved_mb = 0.0
-        self.audit_log = []
+
+        # Deletion records stream to disk as they happen; only a bounded tail stays in memory
+        self.audit_path = audit_path or str(log_dir / "vector_cleanup_audit.ndjson")
+        self.audit_log: Deque[Dict] = deque(maxlen=audit_tail)
+        self._audit_file: Optional[IO[bytes]] = None
+
+        # Resolve MCP tools once per run (None when MCP is not available)
+        self._context_get = _import_mcp_tool("mcp__memory_keeper__context_get", "context_get")
+        self._context_list_channels = _import_mcp_tool(
+            "mcp__memory_keeper__context_list_channels", "context_list_channels"
+        )
 
     async def get_all_agents(self) -> List[str]:
         """
@@ -69,11 +199,12 @@ class VectorCleanupService:
         Returns:
             List of unique agent identifiers (channels)
         """
-        try:
-            # Import MCP function
-            from mcp__memory_keeper__context_list_channels import context_list_channels
+        if self._context_list_channels is None:
+            logger.warning("Memory Keeper MCP not available - using mock data")
+            return ["test-agent-1", "test-agent-2"]
 
-            result = await context_list_channels()
+        try:
+            result = await self._context_list_channels()
             channels = result.get("channels", [])
 
             # Extract channel names
@@ -82,141 +213,119 @@ class VectorCleanupService:
             logger.info(f"Found {len(agent_ids)} agents in Memory Keeper")
             return agent_ids
 
-        except ImportError:
-            logger.warning("Memory Keeper MCP not available - using mock data")
-            return ["test-agent-1", "test-agent-2"]
         except Exception as e:
             logger.error(f"Error fetching agents: {e}")
             return []
 
-    async def get_activity_dates(self, agent_id: str) -> Set[datetime.date]:
+    async def _fetch_entries(self, agent_id: str) -> List[Dict]:
         """
-        Get unique dates when agent had Memory Keeper activity.
+        Fetch all Memory Keeper entries for an agent in a single MCP call.
 
         Args:
             agent_id: Agent identifier (channel name)
 
         Returns:
-            Set of dates with activity
+            List of raw Memory Keeper entries (empty on error)
         """
-        try:
-            from mcp__memory_keeper__context_get import context_get
-
-            # Query all entries for this agent
-            entries = await context_get(channel=agent_id, limit=10000)
-
-            # Extract unique dates
-            activity_dates = set()
-            for entry in entries.get("items", []):
-                if "created_at" in entry:
-                    timestamp = datetime.fromisoformat(entry["created_at"].replace("Z", "+00:00"))
-                    activity_dates.add(timestamp.date())
-
-            logger.debug(f"Agent {agent_id}: {len(activity_dates)} active days")
-            return activity_dates
-
-        except ImportError:
+        if self._context_get is None:
             logger.warning("Memory Keeper MCP not available")
-            return set()
+            return []
+
+        try:
+            entries = await self._context_get(channel=agent_id, limit=10000)
+            return entries.get("items", [])
         except Exception as e:
-            logger.error(f"Error fetching activity dates for {agent_id}: {e}")
-            return set()
+            logger.error(f"Error fetching entries for {agent_id}: {e}")
+            return []
 
-    async def get_vector_memories(self, agent_id: str) -> List[Dict]:
+    def _scan_entries(
+        self, agent_id: str, items: List[Dict]
+    ) -> tuple[Set[int], VectorMemoryColumns]:
         """
-        Get all vector memories for an agent.
-
-        Note: This is a placeholder - actual implementation depends on
-        vector storage backend (Milvus/ChromaDB).
+        Derive activity dates and vector memories from one pass over entries.
 
         Args:
-            agent_id: Agent identifier
+            agent_id: Agent identifier (for logging)
+            items: Raw Memory Keeper entries from _fetch_entries()
 
         Returns:
-            List of memory dicts with: id, created_at, tier, size_bytes
+            Tuple of (activity_dates, vector_memories)
         """
-        # TODO Phase 3: Integrate with actual vector storage
-        # For now, query Memory Keeper for memories marked as vectorized
-        try:
-            from mcp__memory_keeper__context_get import context_get
+        activity_dates = set()
+        vector_memories = VectorMemoryColumns()
+        # Checked once so malformed entries don't pay for a logging call each
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-            entries = await context_get(channel=agent_id, limit=10000)
+        for entry in items:
+            if "created_at" not in entry:
+                continue
 
-            # Filter for vectorized memories (action == "immediate_vectorize")
-            vector_memories = []
-            for entry in entries.get("items", []):
-                try:
-                    value = json.loads(entry.get("value", "{}"))
-                    metadata = value.get("metadata", {})
-
-                    if metadata.get("action") in ["immediate_vectorize", "queue_for_batch"]:
-                        vector_memories.append(
-                            {
-                                "id": entry.get("key"),
-                                "created_at": datetime.fromisoformat(
-                                    entry["created_at"].replace("Z", "+00:00")
-                                ),
-                                "tier": metadata.get("tier", "context"),
-                                "size_bytes": len(entry.get("value", "")),  # Estimate
-                                "content": value.get("content", ""),
-                            }
-                        )
-                except (json.JSONDecodeError, KeyError) as e:
-                    logger.debug(f"Skipping malformed entry: {e}")
-                    continue
-
-            logger.debug(f"Agent {agent_id}: {len(vector_memories)} vector memories")
-            return vector_memories
+            try:
+                # Python 3.11+ parses the trailing "Z" natively (no str.replace copy)
+                created_at = datetime.fromisoformat(entry["created_at"])
+            except ValueError as e:
+                if debug_enabled:
+                    logger.debug("Skipping malformed entry: %s", e)
+                continue
+
+            # Every entry counts as activity
+            # Date ordinals: plain ints hash and compare faster than date objects
+            activity_dates.add(created_at.toordinal())
+
+            # Vectorized memories (action == "immediate_vectorize" or batched)
+            try:
+                value = _json_loads(entry.get("value") or "{}")
+            except ValueError as e:
+                if debug_enabled:
+                    logger.debug("Skipping malformed entry: %s", e)
+                continue
+
+            metadata = value.get("metadata", {})
+            if metadata.get("action") in ["immediate_vectorize", "queue_for_batch"]:
+                vector_memories.append(
+                    memory_id=entry.get("key"),
+                    created_at=created_at,
+                    tier=metadata.get("tier", "context"),
+                    size_bytes=len(entry.get("value", "")),  # Estimate
+                    content=value.get("content", ""),
+                )
 
-        except Exception as e:
-            logger.error(f"Error fetching vector memories for {agent_id}: {e}")
-            return []
+        logger.debug("Agent %s: %d active days", agent_id, len(activity_dates))
+        logger.debug("Agent %s: %d vector memories", agent_id, len(vector_memories))
+        return activity_dates, vector_memories
 
-    def calculate_active_age(
-        self, memory_created_at: datetime, activity_dates: Set[datetime.date]
-    ) -> int:
+    async def get_activity_dates(self, agent_id: str) -> Set[int]:
         """
-        Calculate active age (count only active days).
+        Get unique dates when agent had Memory Keeper activity.
 
         Args:
-            memory_created_at: When memory was created
-            activity_dates: Set of dates with agent activity
+            agent_id: Agent identifier (channel name)
 
         Returns:
-            Number of active days since memory creation
+            Set of date ordinals (date.toordinal()) with activity
         """
-        memory_date = memory_created_at.date()
-        active_days = sum(1 for d in activity_dates if d >= memory_date)
-        return active_days
+        items = await self._fetch_entries(agent_id)
+        activity_dates, _ = self._scan_entries(agent_id, items)
+        return activity_dates
 
-    def should_decay_vector(
-        self, memory: Dict, activity_dates: Set[datetime.date]
-    ) -> tuple[bool, int, int, int]:
+    async def get_vector_memories(self, agent_id: str) -> List[Dict]:
         """
-        Determine if a vector should be deleted based on activity-based TTL.
+        Get all vector memories for an agent.
+
+        Note: This is a placeholder - actual implementation depends on
+        vector storage backend (Milvus/ChromaDB).
 
         Args:
-            memory: Memory dict with created_at, tier
-            activity_dates: Set of dates with agent activity
+            agent_id: Agent identifier
 
         Returns:
-            Tuple of (should_delete, active_age, tier_ttl, calendar_age)
+            List of memory dicts with: id, created_at, tier, size_bytes
         """
-        tier = memory["tier"]
-        tier_ttl = TIER_TTL_DAYS.get(tier)
-
-        # Never decay Tier 0
-        if tier_ttl is None:
-            return False, 0, 0, 0
-
-        # Calculate ages
-        active_age = self.calculate_active_age(memory["created_at"], activity_dates)
-        calendar_age = (datetime.now() - memory["created_at"]).days
-
-        # Decay if active age exceeds TTL
-        should_delete = active_age > tier_ttl
-
-        return should_delete, active_age, tier_ttl, calendar_age
+        # TODO Phase 3: Integrate with actual vector storage
+        # For now, query Memory Keeper for memories marked as vectorized
+        items = await self._fetch_entries(agent_id)
+        _, vector_memories = self._scan_entries(agent_id, items)
+        return [vector_memories.row(i) for i in range(len(vector_memories))]
 
     async def delete_vector(self, memory_id: str, agent_id: str) -> bool:
         """
@@ -234,10 +343,10 @@ class VectorCleanupService:
         """
         # TODO Phase 3: Integrate with actual vector storage
         if self.dry_run:
-            logger.info(f"[DRY RUN] Would delete vector: {memory_id}")
+            logger.info("[DRY RUN] Would delete vector: %s", memory_id)
             return True
 
-        logger.info(f"Deleting vector: {memory_id} (agent: {agent_id})")
+        logger.info("Deleting vector: %s (agent: %s)", memory_id, agent_id)
         # Actual deletion would happen here
         return True
 
@@ -251,59 +360,69 @@ class VectorCleanupService:
         Returns:
             Cleanup stats dict
         """
-        logger.info(f"Starting cleanup for agent: {agent_id}")
+        logger.info("Starting cleanup for agent: %s", agent_id)
 
-        # Get agent activity history
-        activity_dates = await self.get_activity_dates(agent_id)
+        # One MCP fetch yields both the activity history and the vector memories
+        items = await self._fetch_entries(agent_id)
+        activity_dates, vector_memories = self._scan_entries(agent_id, items)
         if not activity_dates:
-            logger.warning(f"No activity found for agent {agent_id} - skipping")
+            logger.warning("No activity found for agent %s - skipping", agent_id)
             return {"agent_id": agent_id, "deleted": 0, "storage_saved_mb": 0.0}
 
-        # Get vector memories
-        vector_memories = await self.get_vector_memories(agent_id)
         if not vector_memories:
-            logger.info(f"No vector memories found for agent {agent_id}")
+            logger.info("No vector memories found for agent %s", agent_id)
             return {"agent_id": agent_id, "deleted": 0, "storage_saved_mb": 0.0}
 
-        # Process each memory
+        # Sort once per agent so each memory's active age is a binary search
+        sorted_days = sorted(activity_dates)
+
+        # Decay mask for the whole agent in one pass over the hot columns
+        to_delete = compute_decay_mask(
+            vector_memories.created_days, vector_memories.tiers, sorted_days
+        )
+
+        # Only memories in the mask pay for deletion and audit record construction
         deleted_count = 0
         storage_saved = 0
         deletions = []
-
-        for memory in vector_memories:
-            should_delete, active_age, tier_ttl, calendar_age = self.should_decay_vector(
-                memory, activity_dates
-            )
-
-            if should_delete:
-                # Delete vector
-                success = await self.delete_vector(memory["id"], agent_id)
-
-                if success:
-                    deleted_count += 1
-                    storage_saved += memory["size_bytes"]
-
-                    # Log deletion
-                    deletion_record = {
-                        "agent_id": agent_id,
-                        "memory_id": memory["id"],
-                        "tier": memory["tier"],
-                        "active_age": active_age,
-                        "calendar_age": calendar_age,
-                        "tier_ttl": tier_ttl,
-                        "size_bytes": memory["size_bytes"],
-                        "deleted_at": datetime.now().isoformat(),
-                        "content_preview": memory["content"][:100] if memory.get("content") else "",
-                    }
-                    deletions.append(deletion_record)
-                    self.audit_log.append(deletion_record)
-
-                    logger.info(
-                        f"Deleted: {memory['id']} | "
-                        f"Tier: {memory['tier']} | "
-                        f"Active age: {active_age}/{tier_ttl} days | "
-                        f"Calendar age: {calendar_age} days"
-                    )
+        now = datetime.now()
+
+        for i, tier_ttl, active_age in to_delete:
+            tier = vector_memories.tiers[i]
+            memory_id = vector_memories.ids[i]
+            calendar_age = (now - vector_memories.created_at[i]).days
+
+            # Delete vector
+            success = await self.delete_vector(memory_id, agent_id)
+
+            if success:
+                size_bytes = vector_memories.sizes[i]
+                deleted_count += 1
+                storage_saved += size_bytes
+
+                # Log deletion
+                deletion_record = {
+                    "agent_id": agent_id,
+                    "memory_id": memory_id,
+                    "tier": tier,
+                    "active_age": active_age,
+                    "calendar_age": calendar_age,
+                    "tier_ttl": tier_ttl,
+                    "size_bytes": size_bytes,
+                    "deleted_at": datetime.now().isoformat(),
+                    "content_preview": vector_memories.content_previews[i],
+                }
+                deletions.append(deletion_record)
+                self._write_audit_record(deletion_record)
+
+                logger.info(
+                    "Deleted: %s | Tier: %s | Active age: %d/%d days | Calendar age: %d days",
+                    memory_id,
+                    tier,
+                    active_age,
+                    tier_ttl,
+                    calendar_age,
+                )
 
         storage_saved_mb = storage_saved / (1024 * 1024)
         self.storage_saved_mb += storage_saved_mb
@@ -319,9 +438,10 @@ class VectorCleanupService:
         }
 
         logger.info(
-            f"Agent {agent_id} cleanup complete: "
-            f"{deleted_count} vectors deleted, "
-            f"{storage_saved_mb:.2f} MB saved"
+            "Agent %s cleanup complete: %d vectors deleted, %.2f MB saved",
+            agent_id,
+            deleted_count,
+            storage_saved_mb,
         )
 
         return result
@@ -343,20 +463,22 @@ class VectorCleanupService:
         # Get all agents
         agent_ids = await self.get_all_agents()
 
-        # Process each agent
-        agent_results = []
-        for agent_id in agent_ids:
-            try:
-                result = await self.cleanup_agent_vectors(agent_id)
-                agent_results.append(result)
-            except Exception as e:
-                logger.error(f"Error cleaning up agent {agent_id}: {e}")
-                agent_results.append(
-                    {
+        # Process agents concurrently (I/O-bound on MCP), bounded by max_concurrency.
+        # Shared counters are only touched between awaits, so no locking is needed.
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _cleanup_one(agent_id: str) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.cleanup_agent_vectors(agent_id)
+                except Exception as e:
+                    logger.error(f"Error cleaning up agent {agent_id}: {e}")
+                    return {
                         "agent_id": agent_id,
                         "error": str(e),
                     }
-                )
+
+        agent_results = list(await asyncio.gather(*(_cleanup_one(a) for a in agent_ids)))
 
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -371,7 +493,7 @@ class VectorCleanupService:
             "total_deleted": self.deletion_count,
             "total_storage_saved_mb": round(self.storage_saved_mb, 2),
             "agent_results": agent_results,
-            "audit_log": self.audit_log,
+            "audit_log": list(self.audit_log),
         }
 
         logger.info("=" * 80)
@@ -384,17 +506,29 @@ class VectorCleanupService:
 
         return summary
 
-    def save_audit_log(self, output_path: Optional[str] = None):
-        """Save audit log to file"""
-        if output_path is None:
-            output_path = str(log_dir / "vector_cleanup_audit.json")
+    def _write_audit_record(self, record: Dict) -> None:
+        """Append one deletion record to the NDJSON audit log (opened on first use)"""
+        self.audit_log.append(record)
+
+        try:
+            if self._audit_file is None:
+                self._audit_file = open(self.audit_path, "ab", buffering=1 << 20)
+            self._audit_file.write(_json_dumps_line(record))
+        except Exception as e:
+            logger.error(f"Error writing audit log: {e}")
+
+    def save_audit_log(self):
+        """Flush and close the streamed audit log"""
+        if self._audit_file is None:
+            return
 
         try:
-            with open(output_path, "w") as f:
-                json.dump(self.audit_log, f, indent=2)
-            logger.info(f"Audit log saved to: {output_path}")
+            self._audit_file.close()
+            logger.info(f"Audit log saved to: {self.audit_path}")
         except Exception as e:
             logger.error(f"Error saving audit log: {e}")
+        finally:
+            self._audit_file = None
 
 
 async def main():
@@ -412,25 +546,35 @@ async def main():
         "--output",
         type=str,
         default=None,
-        help="Output path for audit log (default: logs/vector_cleanup_audit.json)",
+        help="Output path for NDJSON audit log (default: logs/vector_cleanup_audit.ndjson)",
+    )
+
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=16,
+        help="Maximum number of agents cleaned up concurrently (default: 16)",
     )
 
     args = parser.parse_args()
 
     # Run cleanup
-    service = VectorCleanupService(dry_run=args.dry_run)
-
-    if args.agent:
-        # Clean up specific agent
-        result = await service.cleanup_agent_vectors(args.agent)
-        print(json.dumps(result, indent=2))
-    else:
-        # Clean up all agents
-        summary = await service.run_cleanup()
-        print(json.dumps(summary, indent=2))
-
-    # Save audit log
-    service.save_audit_log(args.output)
+    service = VectorCleanupService(
+        dry_run=args.dry_run, max_concurrency=args.max_concurrency, audit_path=args.output
+    )
+
+    try:
+        if args.agent:
+            # Clean up specific agent
+            result = await service.cleanup_agent_vectors(args.agent)
+            print(_json_dumps_pretty(result))
+        else:
+            # Clean up all agents
+            summary = await service.run_cleanup()
+            print(_json_dumps_pretty(summary))
+    finally:
+        # Flush audit log (deletions already made are recorded even if the run fails)
+        service.save_audit_log()
 
 
 if __name__ == "__main__":
@@ -34,6 +34,7 @@ setup(
     ],
     extras_require={
         "neo4j": ["neo4j>=5.14"],
+        "speedups": ["orjson>=3.9"],
         "dev": [
             "pytest>=8.0",
             "pytest-asyncio>=0.24",
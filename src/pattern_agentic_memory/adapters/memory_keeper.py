@@ -17,29 +17,102 @@ Added: Tier promotion prompt system integration
 Extracted from adaptive_memory_integration.py as part of Pattern Agentic Memory System extraction.
 """
 
-import hashlib
+import asyncio
 import json
+import logging
 from datetime import date, datetime
-from typing import Dict, List, Optional, Set
+from typing import Awaitable, Dict, List, Optional, Set, Tuple
 
 from ..core import AdaptiveMemoryOrchestrator
 from ..core.tier_promotion import (
+    access_rate_reached,
+    batched_notifications,
     calculate_expiration_with_bonus,
+    frozen_now,
     log_promotion,
-    should_trigger_promotion_prompt,
+    next_prompt_threshold,
+    prompt_cooldown_elapsed,
     trigger_tier_promotion_prompt,
+    update_access_ema,
     validate_promotion,
 )
+from ..utils.enums import enum_value
+from ..utils.hashing import content_hash
+from ..utils.mcp import import_mcp_tool, mock_mcp_call
+
+try:
+    # Optional: faster JSON codec for Memory Keeper values (pip install ...[speedups])
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Map tier to category (Memory Keeper)
+CATEGORY_MAP = {
+    "anchor": "note",  # Tier 0: Identity anchors
+    "principle": "decision",  # Tier 1: Framework principles
+    "solution": "progress",  # Tier 2: Proven solutions
+    "context": "task",  # Tier 3: Temporary context
+}
+
+# Map decision priority to Memory Keeper priority
+PRIORITY_MAP = {"critical": "high", "high": "high", "medium": "normal", "low": "low"}
+
+
+def _json_dumps(obj: Dict) -> str:
+    """Serialize a Memory Keeper value (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(raw: str) -> Dict:
+    """Parse a Memory Keeper value (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class MemoryKeeperAdapter:
     """Adapter between AdaptiveMemoryOrchestrator and Memory Keeper MCP"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        flush_concurrency: int = 16,
+        access_flush_threshold: int = 32,
+        access_flush_interval: float = 30.0,
+    ):
+        """
+        Args:
+            flush_concurrency: Maximum in-flight Memory Keeper saves during a batch flush
+            access_flush_threshold: Distinct accessed memories buffered before their
+                coalesced access counts are written back
+            access_flush_interval: Seconds after a tracked read before buffered access
+                counts are written back, if the threshold is not reached first
+        """
         self.orchestrator = AdaptiveMemoryOrchestrator()
+        self.flush_concurrency = flush_concurrency
+        self.access_flush_threshold = access_flush_threshold
+        self.access_flush_interval = access_flush_interval
         # Timer for batch flush (future enhancement - Phase 3)
         self.batch_timer = None
 
+        # Resolve MCP tools once instead of importing on every call (None = no MCP)
+        self._context_get = import_mcp_tool("mcp__memory_keeper__context_get", "context_get")
+        self._context_save = import_mcp_tool("mcp__memory_keeper__context_save", "context_save")
+        self._context_search = import_mcp_tool(
+            "mcp__memory_keeper__context_search", "context_search"
+        )
+
+        # Background access-tracking updates (strong refs keep tasks alive until done)
+        self._tracking_tasks: Set[asyncio.Task] = set()
+        # Coalesced tracked reads: memory_key -> (access delta, last accessed, agent_id)
+        self._access_deltas: Dict[str, Tuple[int, datetime, Optional[str]]] = {}
+        # One access flush at a time (overlapping get+save of a memory loses counts)
+        self._access_flush_lock = asyncio.Lock()
+        self._access_flush_timer: Optional[asyncio.TimerHandle] = None
+
     async def save_interaction(
         self,
         content: str,
@@ -59,7 +132,7 @@ class MemoryKeeperAdapter:
         """
 
         # Process through adaptive system
-        decision = await self.orchestrator.process_memory_candidate(
+        decision = self.orchestrator.process_memory_candidate_sync(
             content=content, context=context or {}, existing_memories=existing_memories or []
         )
 
@@ -79,7 +152,11 @@ class MemoryKeeperAdapter:
         return decision
 
     async def _save_to_memory_keeper(
-        self, content: str, decision: Dict, temporary: bool = False
+        self,
+        content: str,
+        decision: Dict,
+        temporary: bool = False,
+        content_digest: Optional[str] = None,
     ) -> str:
         """
         Save to Memory Keeper with adaptive metadata
@@ -88,38 +165,16 @@ class MemoryKeeperAdapter:
             content: Content to save
             decision: Decision dict from orchestrator
             temporary: Whether this is temporary (working memory only)
+            content_digest: Precomputed content_hash(content), e.g. the buffered fingerprint in hex
 
         Returns:
             Key of saved memory
         """
-        # Import here to avoid circular dependency
-        try:
-            from mcp__memory_keeper__context_save import context_save
-        except ImportError:
-            # Fallback for testing without MCP
-            async def context_save(**kwargs):
-                return {"status": "mocked"}
-
-        # Map tier to category (Memory Keeper)
-        category_map = {
-            "anchor": "note",  # Tier 0: Identity anchors
-            "principle": "decision",  # Tier 1: Framework principles
-            "solution": "progress",  # Tier 2: Proven solutions
-            "context": "task",  # Tier 3: Temporary context
-        }
-
-        # Map priority
-        priority_map = {"critical": "high", "high": "high", "medium": "normal", "low": "low"}
+        context_save = self._context_save or mock_mcp_call
 
         # Extract tier value (handle enum or string)
-        tier_value = (
-            decision["tier"].value if hasattr(decision["tier"], "value") else str(decision["tier"])
-        )
-        decay_value = (
-            decision["decay_function"].value
-            if hasattr(decision["decay_function"], "value")
-            else str(decision["decay_function"])
-        )
+        tier_value = enum_value(decision["tier"])
+        decay_value = enum_value(decision["decay_function"])
 
         # Phase 3: Calculate initial expiration with access bonus (starts at 0)
         created_at = datetime.now()
@@ -142,55 +197,187 @@ class MemoryKeeperAdapter:
             # Phase 3: Access tracking fields
             "access_count": 0,
             "last_accessed": None,
+            "next_prompt_at": next_prompt_threshold(0),
             "expires_at": expires_at.isoformat() if expires_at else None,
         }
 
         # Generate key (content hash for deduplication)
-        key = f"adaptive_memory_{hashlib.md5(content.encode()).hexdigest()[:8]}"
+        key = f"adaptive_memory_{content_digest or content_hash(content)}"
 
         # Save to Memory Keeper
         await context_save(
             key=key,
-            value=json.dumps({"content": content, "metadata": metadata}),
-            category=category_map.get(tier_value, "note"),
-            priority=priority_map.get(decision.get("priority", "medium"), "normal"),
+            value=_json_dumps({"content": content, "metadata": metadata}),
+            category=CATEGORY_MAP.get(tier_value, "note"),
+            priority=PRIORITY_MAP.get(decision.get("priority", "medium"), "normal"),
         )
 
         return key
 
     async def _check_batch_threshold(self) -> None:
         """Flush batch queue if threshold reached"""
-        queue = self.orchestrator.get_batch_queue()
-        if len(queue) >= 50:  # Threshold
+        if self.orchestrator.batch_queue_size >= 50:  # Threshold
             await self.flush_batch_queue()
 
+    def _track_in_background(self, update: Awaitable) -> None:
+        """Run an access-tracking update without blocking the caller"""
+        task = asyncio.ensure_future(update)
+        self._tracking_tasks.add(task)
+        task.add_done_callback(self._on_tracking_done)
+
+    def _on_tracking_done(self, task: asyncio.Task) -> None:
+        self._tracking_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Access tracking update failed: {task.exception()}")
+
+    def _record_accesses(self, memory_keys: List[str], agent_id: Optional[str]) -> None:
+        """
+        Buffer tracked reads; write back in the background once enough keys pile up
+        or access_flush_interval seconds have passed
+        """
+        now = datetime.now()
+        deltas = self._access_deltas
+        for memory_key in memory_keys:
+            delta = deltas.get(memory_key)
+            deltas[memory_key] = ((delta[0] if delta else 0) + 1, now, agent_id)
+
+        if len(deltas) >= self.access_flush_threshold:
+            self._track_in_background(self.flush_access_deltas())
+        elif deltas:
+            self._schedule_access_flush()
+
+    def _schedule_access_flush(self) -> None:
+        """Start the access flush timer unless one is already pending"""
+        if self._access_flush_timer is None:
+            self._access_flush_timer = asyncio.get_running_loop().call_later(
+                self.access_flush_interval, self._on_access_flush_timer
+            )
+
+    def _cancel_access_flush(self) -> None:
+        if self._access_flush_timer is not None:
+            self._access_flush_timer.cancel()
+            self._access_flush_timer = None
+
+    def _on_access_flush_timer(self) -> None:
+        self._access_flush_timer = None
+        self._track_in_background(self.flush_access_deltas())
+
+    async def flush_access_deltas(self) -> int:
+        """
+        Write buffered access counts to Memory Keeper
+
+        Each memory gets one get+save for all of its buffered accesses. Flushes
+        run one at a time. Deltas whose update fails are merged back into the
+        buffer (a later flush retries them) and the first failure is re-raised.
+
+        Returns:
+            Number of memories updated
+        """
+        async with self._access_flush_lock:
+            self._cancel_access_flush()
+            deltas = self._access_deltas
+            if not deltas:
+                return 0
+            self._access_deltas = {}
+
+            semaphore = asyncio.Semaphore(self.flush_concurrency)
+
+            async def _update_one(key: str, delta: Tuple[int, datetime, Optional[str]]) -> Dict:
+                access_delta, accessed_at, agent_id = delta
+                async with semaphore:
+                    return await self.update_access_tracking(
+                        key, agent_id, access_delta=access_delta, accessed_at=accessed_at
+                    )
+
+            # Promotion prompts fired by this flush are written to the console together
+            # and measured against one clock reading
+            with batched_notifications(), frozen_now():
+                results = await asyncio.gather(
+                    *(_update_one(key, delta) for key, delta in deltas.items()),
+                    return_exceptions=True,
+                )
+
+            errors = []
+            for (key, delta), result in zip(deltas.items(), results):
+                if not isinstance(result, BaseException):
+                    continue
+                errors.append(result)
+                # Reads recorded during the flush are newer - keep their time and agent
+                pending = self._access_deltas.get(key)
+                if pending is not None:
+                    delta = (delta[0] + pending[0], pending[1], pending[2])
+                self._access_deltas[key] = delta
+            if errors:
+                self._schedule_access_flush()
+                raise errors[0]
+
+            return len(deltas)
+
+    async def drain_access_tracking(self) -> None:
+        """Write buffered access counts and wait for pending background updates"""
+        await self.flush_access_deltas()
+        if self._tracking_tasks:
+            await asyncio.gather(*self._tracking_tasks, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Shut down: write all buffered access counts and queued memories"""
+        self._cancel_access_flush()
+        await self.drain_access_tracking()
+        await self.flush_batch_queue()
+
     async def flush_batch_queue(self) -> int:
         """
         Flush all queued memories to Memory Keeper
 
+        Memories whose save fails are put back at the front of the batch queue
+        (so a later flush retries them) and the first failure is re-raised.
+
         Returns:
             Number of memories flushed
         """
-        queue = self.orchestrator.get_batch_queue()
+        # Settle pending access-tracking writes before the batch writes (a failed
+        # update stays buffered for a later flush and must not block the saves)
+        try:
+            await self.drain_access_tracking()
+        except Exception as e:
+            logger.warning(f"Access tracking update failed: {e}")
+
+        # Detach the queue up front (O(queued), working memory is untouched)
+        queue = self.orchestrator.take_batch_queue()
+
+        # Identical content maps to the same Memory Keeper key, so save it once
+        # (the latest queued decision wins, as it would with sequential saves)
+        unique = list({item["hash"]: item for item in queue}.values())
+
+        # Saves are independent MCP round-trips - overlap them, bounded
+        semaphore = asyncio.Semaphore(self.flush_concurrency)
+
+        async def _save_one(item: Dict) -> str:
+            async with semaphore:
+                return await self._save_to_memory_keeper(
+                    item["content"], item["decision"], content_digest=f"{item['hash']:08x}"
+                )
 
-        for item in queue:
-            await self._save_to_memory_keeper(item["content"], item["decision"])
+        results = await asyncio.gather(
+            *(_save_one(item) for item in unique), return_exceptions=True
+        )
 
-        # Clear queue (remove batch items from buffer)
-        self.orchestrator.memory_buffer = [
-            m
-            for m in self.orchestrator.memory_buffer
-            if m["decision"]["action"] != "queue_for_batch"
-        ]
+        failed = {
+            item["hash"]
+            for item, result in zip(unique, results)
+            if isinstance(result, BaseException)
+        }
+        if failed:
+            self.orchestrator.requeue_batch([item for item in queue if item["hash"] in failed])
+            raise next(result for result in results if isinstance(result, BaseException))
 
         return len(queue)
 
     def get_stats(self) -> Dict:
         """Get adapter statistics"""
-        queue = self.orchestrator.get_batch_queue()
         return {
-            "batch_queue_size": len(queue),
-            "working_memory_size": len(self.orchestrator.memory_buffer),
+            "batch_queue_size": self.orchestrator.batch_queue_size,
+            "working_memory_size": self.orchestrator.buffer_size,
             "threshold": 50,
         }
 
@@ -212,27 +399,25 @@ class MemoryKeeperAdapter:
             active_dates = await adapter.get_activity_dates("oracle-sonnet")
             # Returns {date(2025, 11, 1), date(2025, 11, 2), date(2025, 11, 26)}
         """
-        try:
-            # Import MCP function here to avoid circular dependency
-            from mcp__memory_keeper__context_get import context_get
-        except ImportError:
+        if self._context_get is None:
             # Fallback for testing without MCP
             return set()
 
         # Query all Memory Keeper entries for this agent
         # Note: Assumes agent_id is stored as channel or in metadata
         try:
-            entries = await context_get(channel=agent_id, limit=10000)
+            entries = await self._context_get(channel=agent_id, limit=10000)
 
-            # Extract unique dates from ISO 8601 timestamps
-            activity_dates = set()
-            for entry in entries.get("items", []):
-                if "created_at" in entry:
-                    # Parse ISO 8601 timestamp: "2025-11-21T12:34:56Z"
-                    timestamp = datetime.fromisoformat(entry["created_at"].replace("Z", "+00:00"))
-                    activity_dates.add(timestamp.date())
+            # Extract unique dates from ISO 8601 timestamps: "2025-11-21T12:34:56Z"
+            # The date is the leading "YYYY-MM-DD", so dedupe those prefixes first
+            # and parse each distinct day once instead of every entry's timestamp
+            days = {
+                entry["created_at"][:10]
+                for entry in entries.get("items", [])
+                if "created_at" in entry
+            }
 
-            return activity_dates
+            return {date.fromisoformat(day) for day in days}
 
         except Exception as e:
             # Log error but return empty set to prevent crashes
@@ -266,9 +451,51 @@ class MemoryKeeperAdapter:
 
         return active_days
 
+    def calculate_active_ages(
+        self, memory_created_ats: List[datetime], activity_dates: Set[date]
+    ) -> List[int]:
+        """
+        Calculate active age for many memories of one agent at once.
+
+        Same result as calling calculate_active_age() per memory, but the
+        activity days are packed once into a bitset (bit i = first active day
+        + i) and each memory's active age is a shift plus popcount.
+
+        Args:
+            memory_created_ats: Creation times of the memories
+            activity_dates: Set of dates with Memory Keeper activity
+
+        Returns:
+            Active age per memory, in input order
+        """
+        if not activity_dates:
+            return [0] * len(memory_created_ats)
+
+        ordinals = [d.toordinal() for d in activity_dates]
+        first = min(ordinals)
+        packed = bytearray((max(ordinals) - first) // 8 + 1)
+        for ordinal in ordinals:
+            offset = ordinal - first
+            packed[offset >> 3] |= 1 << (offset & 7)
+        bits = int.from_bytes(packed, "little")
+        total = len(ordinals)
+
+        # Active days on or after creation = set bits at or above the creation offset
+        ages = []
+        for created_at in memory_created_ats:
+            offset = created_at.toordinal() - first
+            ages.append(total if offset <= 0 else (bits >> offset).bit_count())
+        return ages
+
     # ===== Phase 3: Access-Based TTL Extension Methods =====
 
-    async def update_access_tracking(self, memory_key: str, agent_id: Optional[str] = None) -> Dict:
+    async def update_access_tracking(
+        self,
+        memory_key: str,
+        agent_id: Optional[str] = None,
+        access_delta: int = 1,
+        accessed_at: Optional[datetime] = None,
+    ) -> Dict:
         """
         Update access tracking when memory is accessed.
 
@@ -276,60 +503,90 @@ class MemoryKeeperAdapter:
         - Increment access_count
         - Update last_accessed timestamp
         - Recalculate expires_at with +10 days per access (max +70)
-        - Trigger tier promotion prompt if access_count % 7 == 0
+        - Track access frequency (EMA, accesses/day)
+        - Trigger tier promotion prompt when access_count reaches next_prompt_at
+          (every 7 accesses, 7-day cooldown)
 
         Args:
             memory_key: Memory identifier
             agent_id: Agent identifier (for tier promotion prompts)
+            access_delta: Number of accesses to record (coalesced flushes pass > 1)
+            accessed_at: Time of the latest access (default: now)
 
         Returns:
             Updated memory dict with new access tracking data
         """
-        try:
-            from mcp__memory_keeper__context_get import context_get
-            from mcp__memory_keeper__context_save import context_save
-        except ImportError:
+        if self._context_get is None or self._context_save is None:
             # Fallback for testing
             return {"status": "mocked", "access_count": 0}
 
         # Get current memory
-        memory = await context_get(key=memory_key)
+        memory = await self._context_get(key=memory_key)
 
         if not memory or not memory.get("items"):
             return {"status": "error", "message": f"Memory {memory_key} not found"}
 
         memory_item = memory["items"][0]
-        value_data = json.loads(memory_item.get("value", "{}"))
+        value_data = _json_loads(memory_item.get("value") or "{}")
         metadata = value_data.get("metadata", {})
 
         # Increment access count
         current_access_count = metadata.get("access_count", 0)
-        new_access_count = current_access_count + 1
+        new_access_count = current_access_count + access_delta
 
         # Update timestamps
-        now = datetime.now()
+        now = accessed_at or datetime.now()
+        now_iso = now.isoformat()
+        previous_access = metadata.get("last_accessed")
         metadata["access_count"] = new_access_count
-        metadata["last_accessed"] = now.isoformat()
+        metadata["last_accessed"] = now_iso
 
         # Recalculate expiration with access bonus
         tier = metadata.get("tier", "context")
-        created_at = datetime.fromisoformat(metadata.get("timestamp", now.isoformat()))
+        # Only parse a stored timestamp; a missing one means "created now"
+        timestamp = metadata.get("timestamp")
+        created_at = now if timestamp is None else datetime.fromisoformat(timestamp)
         new_expires_at = calculate_expiration_with_bonus(
             tier=tier, access_count=new_access_count, creation_time=created_at
         )
         metadata["expires_at"] = new_expires_at.isoformat() if new_expires_at else None
 
+        # Access frequency since the previous access (or creation for the first one)
+        since = created_at if previous_access is None else datetime.fromisoformat(previous_access)
+        metadata["access_ema"] = update_access_ema(
+            metadata.get("access_ema", 0.0),
+            access_delta,
+            (now - since).total_seconds() / 86400,
+        )
+
+        # Check if tier promotion prompt should trigger (threshold reached by the delta,
+        # access frequency at the target rate, outside the cooldown of the previous
+        # prompt). Memories saved before
+        # next_prompt_at was tracked derive it from their access count.
+        next_prompt_at = metadata.get("next_prompt_at") or next_prompt_threshold(
+            current_access_count
+        )
+        prompt_triggered = False
+        if new_access_count >= next_prompt_at:
+            metadata["next_prompt_at"] = next_prompt_threshold(new_access_count)
+            last_prompt_at = metadata.get("last_prompt_at")
+            if last_prompt_at is not None:
+                last_prompt_at = datetime.fromisoformat(last_prompt_at)
+            prompt_triggered = access_rate_reached(metadata["access_ema"])
+            prompt_triggered = prompt_triggered and prompt_cooldown_elapsed(last_prompt_at, now)
+        if prompt_triggered:
+            metadata["last_prompt_at"] = now_iso
+
         # Save updated memory
         value_data["metadata"] = metadata
-        await context_save(
+        await self._context_save(
             key=memory_key,
-            value=json.dumps(value_data),
+            value=_json_dumps(value_data),
             category=memory_item.get("category", "note"),
             priority=memory_item.get("priority", "normal"),
         )
 
-        # Check if tier promotion prompt should trigger
-        if should_trigger_promotion_prompt(new_access_count):
+        if prompt_triggered:
             content = value_data.get("content", "")
             trigger_tier_promotion_prompt(
                 memory_key=memory_key,
@@ -345,9 +602,10 @@ class MemoryKeeperAdapter:
             "status": "success",
             "memory_key": memory_key,
             "access_count": new_access_count,
-            "last_accessed": now.isoformat(),
+            "last_accessed": now_iso,
             "expires_at": metadata["expires_at"],
-            "promotion_prompt_triggered": should_trigger_promotion_prompt(new_access_count),
+            "access_ema": metadata["access_ema"],
+            "promotion_prompt_triggered": prompt_triggered,
         }
 
     async def context_get_with_tracking(self, key: str, agent_id: Optional[str] = None) -> Dict:
@@ -363,17 +621,15 @@ class MemoryKeeperAdapter:
         Returns:
             Memory dict from context_get()
         """
-        try:
-            from mcp__memory_keeper__context_get import context_get
-        except ImportError:
+        if self._context_get is None:
             return {"status": "mocked"}
 
         # Get memory
-        result = await context_get(key=key)
+        result = await self._context_get(key=key)
 
-        # Update access tracking (fire-and-forget, don't block retrieval)
+        # Update access tracking (coalesced, don't block retrieval)
         if result and result.get("items"):
-            await self.update_access_tracking(key, agent_id)
+            self._record_accesses([key], agent_id)
 
         return result
 
@@ -394,19 +650,18 @@ class MemoryKeeperAdapter:
         Returns:
             List of memory dicts from context_search()
         """
-        try:
-            from mcp__memory_keeper__context_search import context_search
-        except ImportError:
+        if self._context_search is None:
             return []
 
         # Search memories
-        results = await context_search(query=query, **kwargs)
+        results = await self._context_search(query=query, **kwargs)
 
-        # Update access tracking for each result (fire-and-forget)
-        for result in results.get("items", []):
-            key = result.get("key")
-            if key:
-                await self.update_access_tracking(key, agent_id)
+        # Update access tracking for all results in one bulk record (coalesced,
+        # don't block retrieval) - a large result set triggers at most one flush
+        self._record_accesses(
+            [result["key"] for result in results.get("items", []) if result.get("key")],
+            agent_id,
+        )
 
         return results
 
@@ -430,20 +685,17 @@ class MemoryKeeperAdapter:
         Returns:
             Promotion result dict
         """
-        try:
-            from mcp__memory_keeper__context_get import context_get
-            from mcp__memory_keeper__context_save import context_save
-        except ImportError:
+        if self._context_get is None or self._context_save is None:
             return {"status": "mocked"}
 
         # Get current memory
-        memory = await context_get(key=memory_key)
+        memory = await self._context_get(key=memory_key)
 
         if not memory or not memory.get("items"):
             return {"status": "error", "message": f"Memory {memory_key} not found"}
 
         memory_item = memory["items"][0]
-        value_data = json.loads(memory_item.get("value", "{}"))
+        value_data = _json_loads(memory_item.get("value") or "{}")
         metadata = value_data.get("metadata", {})
 
         old_tier = metadata.get("tier", "context")
@@ -455,14 +707,18 @@ class MemoryKeeperAdapter:
             return {"status": "error", "message": reason}
 
         # Update tier and reset access count
+        now = datetime.now()
         metadata["tier"] = new_tier
         metadata["access_count"] = 0  # Reset for future promotions
-        metadata["promoted_at"] = datetime.now().isoformat()
+        metadata["next_prompt_at"] = next_prompt_threshold(0)
+        metadata["promoted_at"] = now.isoformat()
         metadata["promoted_by"] = promoted_by
         metadata["previous_tier"] = old_tier
 
         # Recalculate expiration for new tier
-        created_at = datetime.fromisoformat(metadata.get("timestamp", datetime.now().isoformat()))
+        # Only parse a stored timestamp; a missing one means "created now"
+        timestamp = metadata.get("timestamp")
+        created_at = now if timestamp is None else datetime.fromisoformat(timestamp)
         new_expires_at = calculate_expiration_with_bonus(
             tier=new_tier,
             access_count=0,  # Reset
@@ -472,9 +728,9 @@ class MemoryKeeperAdapter:
 
         # Save updated memory
         value_data["metadata"] = metadata
-        await context_save(
+        await self._context_save(
             key=memory_key,
-            value=json.dumps(value_data),
+            value=_json_dumps(value_data),
             category=memory_item.get("category", "note"),
             priority=memory_item.get("priority", "normal"),
         )
@@ -9,10 +9,13 @@ Architect: Oracle Sonnet (pa-inference-1)
 Extracted from neo4j_working_memory.py as part of Pattern Agentic Memory System extraction.
 """
 
-import hashlib
 from datetime import datetime
 from typing import Dict, Optional
 
+from ..utils.enums import enum_value
+from ..utils.hashing import content_hash
+from ..utils.mcp import import_mcp_tool, mock_mcp_call
+
 
 class Neo4jWorkingMemory:
     """Neo4j adapter for working memory (Tier 3 rapid access)"""
@@ -20,6 +23,20 @@ class Neo4jWorkingMemory:
     def __init__(self):
         self.policies_initialized = False
 
+        # Resolve MCP tools once instead of importing on every call
+        # (writes fall back to a mock, search to None = no results)
+        self._create_entities = (
+            import_mcp_tool("mcp__neo4j_memory__create_entities", "create_entities")
+            or mock_mcp_call
+        )
+        self._create_relations = (
+            import_mcp_tool("mcp__neo4j_memory__create_relations", "create_relations")
+            or mock_mcp_call
+        )
+        self._search_memories = import_mcp_tool(
+            "mcp__neo4j_memory__search_memories", "search_memories"
+        )
+
     async def initialize_tier_policies(self) -> bool:
         """
         Create tier policy entities if they don't exist
@@ -28,13 +45,6 @@ class Neo4jWorkingMemory:
         Returns:
             True if successful
         """
-        try:
-            from mcp__neo4j_memory__create_entities import create_entities
-        except ImportError:
-            # Fallback for testing without MCP
-            async def create_entities(data=None, **kwargs):
-                return {"status": "mocked"}
-
         policies = [
             {
                 "name": "Tier_anchor_Policy",
@@ -78,7 +88,7 @@ class Neo4jWorkingMemory:
             },
         ]
 
-        await create_entities({"entities": policies})
+        await self._create_entities({"entities": policies})
         self.policies_initialized = True
         return True
 
@@ -96,31 +106,13 @@ class Neo4jWorkingMemory:
         Returns:
             Entity name created
         """
-        try:
-            from mcp__neo4j_memory__create_entities import create_entities
-            from mcp__neo4j_memory__create_relations import create_relations
-        except ImportError:
-            # Fallback for testing
-            async def create_entities(data=None, **kwargs):
-                return {"status": "mocked"}
-
-            async def create_relations(data=None, **kwargs):
-                return {"status": "mocked"}
-
         # Generate entity name with timestamp + hash
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        content_hash = hashlib.md5(content.encode()).hexdigest()[:6]
-        entity_name = f"Memory_{timestamp}_{content_hash}"
+        entity_name = f"Memory_{timestamp}_{content_hash(content, digest_size=3)}"
 
         # Extract tier and decay values
-        tier_value = (
-            decision["tier"].value if hasattr(decision["tier"], "value") else str(decision["tier"])
-        )
-        decay_value = (
-            decision["decay_function"].value
-            if hasattr(decision["decay_function"], "value")
-            else str(decision["decay_function"])
-        )
+        tier_value = enum_value(decision["tier"])
+        decay_value = enum_value(decision["decay_function"])
 
         # Build observations
         observations = [
@@ -142,7 +134,7 @@ class Neo4jWorkingMemory:
                 observations.append(f"Context_{key}: {value}")
 
         # Create memory entity
-        await create_entities(
+        await self._create_entities(
             {
                 "entities": [
                     {"name": entity_name, "type": "WorkingMemory", "observations": observations}
@@ -151,7 +143,7 @@ class Neo4jWorkingMemory:
         )
 
         # Link to tier policy
-        await create_relations(
+        await self._create_relations(
             {
                 "relations": [
                     {
@@ -176,12 +168,10 @@ class Neo4jWorkingMemory:
         Returns:
             List of matching entities
         """
-        try:
-            from mcp__neo4j_memory__search_memories import search_memories
-        except ImportError:
+        if self._search_memories is None:
             return []
 
-        results = await search_memories(query=query)
+        results = await self._search_memories(query=query)
 
         # Filter for WorkingMemory type
         working_memories = [r for r in results if "WorkingMemory" in str(r)]
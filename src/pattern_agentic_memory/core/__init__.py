@@ -8,7 +8,14 @@ Public API exports for core memory system components.
 """
 
 from .command_parser import UserMemoryCommandParser
-from .decay_functions import DecayFunction, calculate_decay_timestamp, should_decay
+from .content_view import ContentView
+from .decay_functions import (
+    DecayFunction,
+    calculate_decay_timestamp,
+    should_decay,
+    should_decay_batch,
+    should_decay_ns,
+)
 from .importance_evaluator import MemoryImportanceEvaluator
 from .memory_system import AdaptiveMemoryOrchestrator
 from .tier_classifier import H200TierClassifier, MemoryTier
@@ -20,10 +27,13 @@ __all__ = [
     "MemoryImportanceEvaluator",
     "H200TierClassifier",
     "UserMemoryCommandParser",
+    "ContentView",
     # Enums
     "MemoryTier",
     "DecayFunction",
     # Utility functions
     "calculate_decay_timestamp",
     "should_decay",
+    "should_decay_batch",
+    "should_decay_ns",
 ]
@@ -8,6 +8,8 @@ Extracted from adaptive_memory_system.py as part of Pattern Agentic Memory Syste
 import re
 from typing import Any, Dict, Optional
 
+from .content_view import ContentView
+
 
 class UserMemoryCommandParser:
     """
@@ -28,43 +30,72 @@ class UserMemoryCommandParser:
         "critical": "priority_save",
     }
 
-    # Separate pattern-based rules (checked after exact matches)
+    # All triggers as one alternation: a single C-level scan tells whether any
+    # trigger occurs at all (the common case for ordinary messages is "none")
+    _TRIGGER_RE = re.compile("|".join(re.escape(trigger) for trigger in MEMORY_COMMANDS))
+
+    # Separate pattern-based rules (checked after exact matches), compiled once
     RULE_PATTERNS = [
-        (r"^always\s+\w+", "save_as_rule"),  # "Always validate..." (must start sentence)
-        (r"^never\s+(?!fade)", "save_as_constraint"),  # "Never skip..." (but not "Never Fade")
+        # "Always validate..." (must start sentence)
+        (re.compile(r"^always\s+\w+"), "save_as_rule"),
+        # "Never skip..." (but not "Never Fade")
+        (re.compile(r"^never\s+(?!fade)"), "save_as_constraint"),
+    ]
+    _RULE_PREFIXES = ("always", "never")
+
+    # Implicit teaching cues
+    TEACHING_PATTERNS = [
+        re.compile(pattern)
+        for pattern in (
+            r"you should always",
+            r"make sure to",
+            r"don\'t forget to",
+            r"remember to",
+            r"next time",
+            r"in the future",
+        )
     ]
 
-    def parse_user_intent(self, message: str) -> Optional[Dict[str, Any]]:
+    def parse_user_intent(
+        self, message: str, content_view: Optional[ContentView] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Detect explicit memory commands in natural language.
 
+        Args:
+            message: The user message
+            content_view: Precomputed view of message (lowercased once by the orchestrator)
+
         Returns:
             {action, confidence, scope} dict or None
         """
-        message_lower = message.lower()
-
-        # Check for explicit commands
-        for trigger, action in self.MEMORY_COMMANDS.items():
-            if trigger in message_lower:
-                return {
-                    "action": action,
-                    "confidence": 0.9,
-                    "scope": self._determine_scope(message, trigger),
-                    "user_commanded": True,
-                }
+        message_lower = content_view.lower if content_view is not None else message.lower()
+
+        # Check for explicit commands (first trigger in MEMORY_COMMANDS order wins)
+        if self._TRIGGER_RE.search(message_lower):
+            for trigger, action in self.MEMORY_COMMANDS.items():
+                if trigger in message_lower:
+                    return {
+                        "action": action,
+                        "confidence": 0.9,
+                        "scope": self._determine_scope(message_lower, trigger),
+                        "user_commanded": True,
+                    }
 
         # Check for pattern-based rules (e.g., "Always [action]", "Never [action]")
-        for pattern, action in self.RULE_PATTERNS:
-            if re.search(pattern, message_lower):
-                return {
-                    "action": action,
-                    "confidence": 0.85,
-                    "scope": "current_message",
-                    "user_commanded": True,
-                }
+        # Both rules are anchored at the start, so other messages skip the regexes
+        if message_lower.startswith(self._RULE_PREFIXES):
+            for pattern, action in self.RULE_PATTERNS:
+                if pattern.search(message_lower):
+                    return {
+                        "action": action,
+                        "confidence": 0.85,
+                        "scope": "current_message",
+                        "user_commanded": True,
+                    }
 
         # Check for implicit memory cues
-        if self._contains_teaching_pattern(message):
+        if self._contains_teaching_pattern(message_lower):
             return {
                 "action": "potential_lesson",
                 "confidence": 0.6,
@@ -74,25 +105,15 @@ class UserMemoryCommandParser:
 
         return None
 
-    def _determine_scope(self, message: str, trigger: str) -> str:
-        """Determine what scope the memory command applies to"""
-        if "conversation" in message.lower():
+    def _determine_scope(self, message_lower: str, trigger: str) -> str:
+        """Determine what scope the memory command applies to (expects a lowercased message)"""
+        if "conversation" in message_lower:
             return "full_conversation"
-        elif "this" in message.lower():
+        elif "this" in message_lower:
             return "current_message"
         else:
             return "recent_context"
 
-    def _contains_teaching_pattern(self, message: str) -> bool:
-        """Check if message contains implicit teaching patterns"""
-        teaching_patterns = [
-            r"you should always",
-            r"make sure to",
-            r"don\'t forget to",
-            r"remember to",
-            r"next time",
-            r"in the future",
-        ]
-
-        message_lower = message.lower()
-        return any(re.search(pattern, message_lower) for pattern in teaching_patterns)
+    def _contains_teaching_pattern(self, message_lower: str) -> bool:
+        """Check if a lowercased message contains implicit teaching patterns"""
+        return any(pattern.search(message_lower) for pattern in self.TEACHING_PATTERNS)
@@ -0,0 +1,26 @@
+"""
+Per-candidate content view shared by the parser, evaluator and classifier.
+Lowercases a memory candidate once instead of once per component.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import FrozenSet
+
+
+@dataclass(frozen=True)
+class ContentView:
+    """A memory candidate's content with its derived forms, each computed at most once"""
+
+    raw: str
+    lower: str
+
+    @classmethod
+    def of(cls, content: str) -> "ContentView":
+        """Build the view for a raw content string"""
+        return cls(raw=content, lower=content.lower())
+
+    @cached_property
+    def tokens(self) -> FrozenSet[str]:
+        """Lowercased whitespace tokens (only built when similarity is checked)"""
+        return frozenset(self.lower.split())
@@ -4,14 +4,20 @@ Decay strategies for different memory tiers.
 Extracted from adaptive_memory_system.py as part of Pattern Agentic Memory System extraction.
 """
 
+import time
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional
+from typing import Iterable, List, Optional
 
 
 class DecayFunction(Enum):
     """Decay strategies for different memory tiers"""
 
+    # Age policy of each member, attached below from DECAY_POLICY_MAP
+    # (annotated without a value, so these are attributes rather than members)
+    delta: Optional[timedelta]
+    delta_ns: Optional[int]  # Integer age limit for epoch-nanosecond sweeps
+
     NEVER = "never"  # Tier 0: Forever
     SUPERSEDED_ONLY = "superseded_only"  # Tier 1: 6 months
     STALENESS_6MONTHS = "staleness_6months"  # Tier 2: 1 month
@@ -27,6 +33,27 @@ DECAY_POLICY_MAP = {
     DecayFunction.RAPID_14DAYS: timedelta(days=14),  # Tier 3: 14 days
 }
 
+# TTL in whole days per decay function (None = never decays)
+TTL_DAYS = {
+    decay_function: None if delta is None else delta.days
+    for decay_function, delta in DECAY_POLICY_MAP.items()
+}
+
+# Decay functions that never expire by age alone
+_NO_DECAY = frozenset({DecayFunction.NEVER, DecayFunction.SUPERSEDED_ONLY})
+
+# Attach each policy to its member so the sweeps read decay_function.delta
+# instead of hashing into DECAY_POLICY_MAP
+for _decay_function, _delta in DECAY_POLICY_MAP.items():
+    _decay_function.delta = _delta
+    # None = never decays by age
+    _decay_function.delta_ns = (
+        None
+        if _delta is None or _decay_function in _NO_DECAY
+        else _delta // timedelta(microseconds=1) * 1000
+    )
+del _decay_function, _delta
+
 
 def calculate_decay_timestamp(
     decay_function: DecayFunction, creation_time: Optional[datetime] = None
@@ -71,12 +98,76 @@ def should_decay(
         current_time = datetime.now()
 
     # Never decay or superseded only
-    if decay_function in [DecayFunction.NEVER, DecayFunction.SUPERSEDED_ONLY]:
+    if decay_function in _NO_DECAY:
         return False
 
-    # Calculate decay time
-    decay_time = calculate_decay_timestamp(decay_function, memory_timestamp)
-    if decay_time is None:
-        return False
+    # Compare age against the policy directly (no intermediate decay timestamp)
+    delta = DECAY_POLICY_MAP.get(decay_function)
+    return delta is not None and current_time - memory_timestamp >= delta
+
+
+def should_decay_ns(
+    memory_ns: int, decay_function: DecayFunction, current_ns: Optional[int] = None
+) -> bool:
+    """
+    Integer-timestamp variant of should_decay() for tight sweeps.
+
+    Callers read time.time_ns() once and pass epoch nanoseconds, so no
+    datetime objects are created per memory.
+
+    Args:
+        memory_ns: When the memory was created (epoch nanoseconds)
+        decay_function: The decay strategy to apply
+        current_ns: Current time in epoch nanoseconds (default: time.time_ns())
+
+    Returns:
+        True if memory should be decayed
+    """
+    if current_ns is None:
+        current_ns = time.time_ns()
+
+    delta_ns = decay_function.delta_ns
+    return delta_ns is not None and current_ns - memory_ns >= delta_ns
+
+
+def should_decay_batch(
+    memory_timestamps: Iterable[datetime],
+    decay_functions: Iterable[DecayFunction],
+    current_time: Optional[datetime] = None,
+) -> List[bool]:
+    """
+    Check a batch of memories for decay in one sweep.
+
+    Equivalent to calling should_decay() per memory, but the decay cutoff
+    (current_time - delta) is computed once per decay function, so each
+    memory costs a single datetime comparison.
+
+    Args:
+        memory_timestamps: When each memory was created
+        decay_functions: The decay strategy of each memory (same order)
+        current_time: Current time for comparison (default: now)
+
+    Returns:
+        List of booleans, True where the memory should be decayed
+
+    Raises:
+        ValueError: If memory_timestamps and decay_functions differ in length
+    """
+    if current_time is None:
+        current_time = datetime.now()
 
-    return current_time >= decay_time
+    # Memories created at or before the cutoff have decayed; None = never decays
+    cutoffs = {
+        decay_function: (
+            None
+            if decay_function in _NO_DECAY or decay_function.delta is None
+            else current_time - decay_function.delta
+        )
+        for decay_function in DecayFunction
+    }
+
+    results = []
+    for memory_timestamp, decay_function in zip(memory_timestamps, decay_functions, strict=True):
+        cutoff = cutoffs[decay_function]
+        results.append(cutoff is not None and memory_timestamp <= cutoff)
+    return results
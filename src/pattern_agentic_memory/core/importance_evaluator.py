@@ -6,7 +6,16 @@ Extracted from adaptive_memory_system.py as part of Pattern Agentic Memory Syste
 """
 
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .content_view import ContentView
+
+
+@lru_cache(maxsize=1024)
+def _token_set(text: str) -> FrozenSet[str]:
+    """Lowercased whitespace token set, cached since existing memories recur across calls"""
+    return frozenset(text.lower().split())
 
 
 class MemoryImportanceEvaluator:
@@ -15,6 +24,30 @@ class MemoryImportanceEvaluator:
     Agent self-assesses whether something should be vectorized.
     """
 
+    # Explicit emphasis markers, matched anywhere as one alternation
+    EMPHASIS_MARKERS = (
+        "remember this",
+        "important",
+        "always",
+        "never forget",
+        "critical",
+        "lesson learned",
+        "never fade to black",
+    )
+    _EMPHASIS_RE = re.compile("|".join(re.escape(marker) for marker in EMPHASIS_MARKERS))
+
+    # Contradiction markers (using word boundaries), compiled into one pattern
+    _CONTRADICTION_RE = re.compile(
+        r"\b(?:actually|correction|my mistake|wrong about|turns out|instead|not|opposite)\b"
+    )
+
+    # Both marker sets in one pass; the leftmost hit tells which set still needs a search
+    _MARKER_RE = re.compile(
+        f"(?P<contradiction>{_CONTRADICTION_RE.pattern})|(?P<emphasis>{_EMPHASIS_RE.pattern})"
+    )
+
+    __slots__ = ("criteria_weights",)
+
     def __init__(self):
         # Opus's criteria weights
         self.criteria_weights = {
@@ -26,7 +59,11 @@ class MemoryImportanceEvaluator:
         }
 
     def evaluate_memory_candidate(
-        self, content: str, context: Dict[str, Any], existing_memories: Optional[List[str]] = None
+        self,
+        content: str,
+        context: Dict[str, Any],
+        existing_memories: Optional[List[str]] = None,
+        content_view: Optional[ContentView] = None,
     ) -> Tuple[float, str]:
         """
         Evaluate if content should be vectorized.
@@ -35,16 +72,23 @@ class MemoryImportanceEvaluator:
             content: The memory content to evaluate
             context: Context about the interaction
             existing_memories: Previous similar memories for comparison
+            content_view: Precomputed view of content (lowercased once by the orchestrator)
 
         Returns:
             (score, reasoning) tuple
         """
         score = 0.0
         reasons = []
+        if content_view is None:
+            content_view = ContentView.of(content)
+        content_lower = content_view.lower
+        has_emphasis, has_contradiction_marker = self._scan_markers(content_lower)
 
         # Criterion 1: Novel information (0.30)
         if existing_memories:
-            similarity = self._check_similarity_to_existing(content, existing_memories)
+            similarity = self._check_similarity_to_existing(
+                content, existing_memories, content_view.tokens
+            )
             if similarity < 0.7:  # Threshold for "different enough"
                 score += self.criteria_weights["novel_information"]
                 reasons.append(f"Novel information (similarity: {similarity:.2f})")
@@ -54,21 +98,12 @@ class MemoryImportanceEvaluator:
             reasons.append("Novel information (first of its kind)")
 
         # Criterion 2: Error correction (0.25)
-        if self._contradicts_existing(content, context):
+        if has_contradiction_marker or context.get("corrects_previous_error", False):
             score += self.criteria_weights["error_correction"]
             reasons.append("Corrects previous error/misunderstanding")
 
         # Criterion 3: User emphasis (0.20)
-        emphasis_markers = [
-            "remember this",
-            "important",
-            "always",
-            "never forget",
-            "critical",
-            "lesson learned",
-            "never fade to black",
-        ]
-        if any(marker in content.lower() for marker in emphasis_markers):
+        if has_emphasis:
             score += self.criteria_weights["user_emphasis"]
             reasons.append("User explicitly emphasized")
 
@@ -91,46 +126,45 @@ class MemoryImportanceEvaluator:
         )
         return score, reasoning
 
-    def _check_similarity_to_existing(self, content: str, existing_memories: List[str]) -> float:
+    def _check_similarity_to_existing(
+        self,
+        content: str,
+        existing_memories: List[str],
+        content_tokens: Optional[FrozenSet[str]] = None,
+    ) -> float:
         """Simple similarity check (can be enhanced with embeddings later)"""
         # Simple token-based similarity
-        content_tokens = set(content.lower().split())
+        if content_tokens is None:
+            content_tokens = _token_set(content)
+        if not content_tokens:
+            return 0.0
+        content_size = len(content_tokens)
 
         max_similarity = 0.0
         for memory in existing_memories[:10]:  # Check last 10 memories
-            memory_tokens = set(memory.lower().split())
+            memory_tokens = _token_set(memory)
 
-            if len(content_tokens) == 0 or len(memory_tokens) == 0:
+            if not memory_tokens:
                 continue
 
-            intersection = len(content_tokens & memory_tokens)
-            union = len(content_tokens | memory_tokens)
-            similarity = intersection / union if union > 0 else 0.0
+            # |A | B| = |A| + |B| - |A & B|, so no union set is built
+            intersection = len(content_tokens.intersection(memory_tokens))
+            similarity = intersection / (content_size + len(memory_tokens) - intersection)
 
-            max_similarity = max(max_similarity, similarity)
+            if similarity > max_similarity:
+                max_similarity = similarity
+                if max_similarity == 1.0:
+                    break  # Identical token sets, nothing can score higher
 
         return max_similarity
 
-    def _contradicts_existing(self, content: str, context: Dict[str, Any]) -> bool:
-        """Check if this content contradicts previous knowledge"""
-        # Look for contradiction markers (using word boundaries)
-        contradiction_patterns = [
-            r"\bactually\b",
-            r"\bcorrection\b",
-            r"\bmy mistake\b",
-            r"\bwrong about\b",
-            r"\bturns out\b",
-            r"\binstead\b",
-            r"\bnot\b",
-            r"\bopposite\b",
-        ]
-
-        content_lower = content.lower()
-        has_contradiction_marker = any(
-            re.search(pattern, content_lower) for pattern in contradiction_patterns
-        )
-
-        # Check if context indicates error correction
-        is_error_correction = context.get("corrects_previous_error", False)
+    def _scan_markers(self, content_lower: str) -> Tuple[bool, bool]:
+        """(has emphasis marker, has contradiction marker) for lowercased content"""
+        first = self._MARKER_RE.search(content_lower)
+        if first is None:
+            return False, False
 
-        return has_contradiction_marker or is_error_correction
+        # Nothing of the other set starts before the leftmost hit, so resume from there
+        if first.lastgroup == "emphasis":
+            return True, self._CONTRADICTION_RE.search(content_lower, first.start()) is not None
+        return self._EMPHASIS_RE.search(content_lower, first.start()) is not None, True
@@ -7,15 +7,37 @@ Purpose: Solve the "95 fragmented sessions with no decay strategy" problem befor
 Extracted from adaptive_memory_system.py as part of Pattern Agentic Memory System extraction.
 """
 
-import hashlib
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from ..utils.hashing import content_fingerprint
 from .command_parser import UserMemoryCommandParser
+from .content_view import ContentView
 from .decay_functions import DecayFunction
 from .importance_evaluator import MemoryImportanceEvaluator
 from .tier_classifier import H200TierClassifier, MemoryTier
 
+# Decision matrix: tier -> (normal importance, high importance) -> (action, priority, label)
+_DECISION_TABLE = {
+    MemoryTier.TIER0_ANCHOR: (
+        None,  # Anchors are always vectorized, whatever their importance
+        ("immediate_vectorize", "critical", "Tier 0 anchor (never decay)"),
+    ),
+    MemoryTier.TIER1_PRINCIPLE: (
+        ("queue_for_batch", "medium", "Tier 1 principle + medium importance"),
+        ("immediate_vectorize", "high", "Tier 1 principle + high importance"),
+    ),
+    MemoryTier.TIER2_SOLUTION: (
+        ("working_memory_only", "low", "Tier 2 solution + low importance"),
+        ("queue_for_batch", "medium", "Tier 2 solution + high importance"),
+    ),
+    MemoryTier.TIER3_CONTEXT: (
+        ("working_memory_only", "low", "Tier 3 context + normal importance"),
+        ("queue_for_batch", "medium", "Tier 3 context + exceptional importance"),
+    ),
+}
+_DEFAULT_DECISION = ("working_memory_only", "low", "Default: working memory")
+
 
 class AdaptiveMemoryOrchestrator:
     """
@@ -23,6 +45,18 @@ class AdaptiveMemoryOrchestrator:
     Makes intelligent decisions about memory formation.
     """
 
+    __slots__ = (
+        "importance_evaluator",
+        "tier_classifier",
+        "command_parser",
+        "tier1_threshold",
+        "tier2_threshold",
+        "tier3_threshold",
+        "vectorization_threshold",
+        "working_buffer",
+        "batch_buffer",
+    )
+
     def __init__(self):
         self.importance_evaluator = MemoryImportanceEvaluator()
         self.tier_classifier = H200TierClassifier()
@@ -34,8 +68,29 @@ class AdaptiveMemoryOrchestrator:
         self.tier3_threshold = 0.8  # Context: Highest threshold (rare to vectorize)
         self.vectorization_threshold = 0.6  # Legacy/fallback
 
-        # Memory buffer (working memory)
-        self.memory_buffer: List[Dict[str, Any]] = []
+        # Memory buffer (working memory), partitioned by action so a batch
+        # flush only touches the queued items
+        self.working_buffer: List[Dict[str, Any]] = []
+        self.batch_buffer: List[Dict[str, Any]] = []
+
+    def buffered_items(self) -> List[Dict[str, Any]]:
+        """
+        Snapshot of all buffered memories.
+
+        Working memory items come first, then the batch queue, each in insertion
+        order. The list is a new copy: editing it does not change the buffers.
+        """
+        return self.working_buffer + self.batch_buffer
+
+    @property
+    def buffer_size(self) -> int:
+        """Number of buffered memories (O(1), without building a snapshot)"""
+        return len(self.working_buffer) + len(self.batch_buffer)
+
+    @property
+    def batch_queue_size(self) -> int:
+        """Number of memories queued for batch vectorization (O(1))"""
+        return len(self.batch_buffer)
 
     async def process_memory_candidate(
         self, content: str, context: Dict[str, Any], existing_memories: Optional[List[str]] = None
@@ -46,10 +101,53 @@ class AdaptiveMemoryOrchestrator:
         Returns:
             Decision dict with action, tier, decay_function, reasoning
         """
+        return self.process_memory_candidate_sync(content, context, existing_memories)
+
+    async def process_memory_candidates(
+        self,
+        contents: List[str],
+        contexts: Optional[List[Dict[str, Any]]] = None,
+        existing_memories: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch entry point: decide many candidates with one await.
+
+        Args:
+            contents: Memory candidates to process
+            contexts: Per-candidate context dicts (same order; default: empty contexts)
+            existing_memories: Previous memories compared against every candidate
+
+        Returns:
+            Decision dicts in the order of contents
+        """
+        if contexts is None:
+            contexts = [{} for _ in contents]
+        elif len(contexts) != len(contents):
+            raise ValueError(
+                f"contexts has {len(contexts)} entries, expected one per content ({len(contents)})"
+            )
+
+        process = self.process_memory_candidate_sync
+        return [
+            process(content, context, existing_memories)
+            for content, context in zip(contents, contexts)
+        ]
+
+    def process_memory_candidate_sync(
+        self, content: str, context: Dict[str, Any], existing_memories: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Synchronous process_memory_candidate (the decision never awaits anything).
+
+        Lets synchronous callers and internal adapters skip the coroutine round-trip.
+        """
+        # Lowercase once for the parser, evaluator and classifier
+        content_view = ContentView.of(content)
+
         # Step 1: Check for user override
-        user_command = self.command_parser.parse_user_intent(content)
+        user_command = self.command_parser.parse_user_intent(content, content_view)
         if user_command and user_command["user_commanded"]:
-            tier, decay = self.tier_classifier.classify_memory_tier(content, context)
+            tier, decay = self.tier_classifier.classify_memory_tier(content, context, content_view)
             return {
                 "action": "immediate_vectorize",
                 "tier": tier,
@@ -61,11 +159,15 @@ class AdaptiveMemoryOrchestrator:
 
         # Step 2: Evaluate importance (Opus scoring)
         importance_score, importance_reasoning = (
-            self.importance_evaluator.evaluate_memory_candidate(content, context, existing_memories)
+            self.importance_evaluator.evaluate_memory_candidate(
+                content, context, existing_memories, content_view
+            )
         )
 
         # Step 3: Classify tier (H200 hierarchy)
-        memory_tier, decay_function = self.tier_classifier.classify_memory_tier(content, context)
+        memory_tier, decay_function = self.tier_classifier.classify_memory_tier(
+            content, context, content_view
+        )
 
         # Step 4: Combined decision matrix
         decision = self._make_decision(
@@ -87,94 +189,64 @@ class AdaptiveMemoryOrchestrator:
         """
         # Tier 0: Always vectorize anchors
         if memory_tier == MemoryTier.TIER0_ANCHOR:
-            return {
-                "action": "immediate_vectorize",
-                "tier": memory_tier,
-                "decay_function": decay_function,
-                "reasoning": f"Tier 0 anchor (never decay) | {reasoning}",
-                "priority": "critical",
-            }
-
+            outcome = _DECISION_TABLE[memory_tier][True]
         # Tier 1: Vectorize if importance >= 0.5
         elif memory_tier == MemoryTier.TIER1_PRINCIPLE:
-            if importance_score >= self.tier1_threshold:
-                return {
-                    "action": "immediate_vectorize",
-                    "tier": memory_tier,
-                    "decay_function": decay_function,
-                    "reasoning": f"Tier 1 principle + high importance | {reasoning}",
-                    "priority": "high",
-                }
-            else:
-                return {
-                    "action": "queue_for_batch",
-                    "tier": memory_tier,
-                    "decay_function": decay_function,
-                    "reasoning": f"Tier 1 principle + medium importance | {reasoning}",
-                    "priority": "medium",
-                }
-
+            outcome = _DECISION_TABLE[memory_tier][importance_score >= self.tier1_threshold]
         # Tier 2: Batch if importance > 0.7, else working memory
         elif memory_tier == MemoryTier.TIER2_SOLUTION:
-            if importance_score > self.tier2_threshold:
-                return {
-                    "action": "queue_for_batch",
-                    "tier": memory_tier,
-                    "decay_function": decay_function,
-                    "reasoning": f"Tier 2 solution + high importance | {reasoning}",
-                    "priority": "medium",
-                }
-            else:
-                return {
-                    "action": "working_memory_only",
-                    "tier": memory_tier,
-                    "decay_function": decay_function,
-                    "reasoning": f"Tier 2 solution + low importance | {reasoning}",
-                    "priority": "low",
-                }
-
+            outcome = _DECISION_TABLE[memory_tier][importance_score > self.tier2_threshold]
         # Tier 3: Only vectorize if importance > 0.8
         elif memory_tier == MemoryTier.TIER3_CONTEXT:
-            if importance_score > self.tier3_threshold:
-                return {
-                    "action": "queue_for_batch",
-                    "tier": memory_tier,
-                    "decay_function": decay_function,
-                    "reasoning": f"Tier 3 context + exceptional importance | {reasoning}",
-                    "priority": "medium",
-                }
-            else:
-                return {
-                    "action": "working_memory_only",
-                    "tier": memory_tier,
-                    "decay_function": decay_function,
-                    "reasoning": f"Tier 3 context + normal importance | {reasoning}",
-                    "priority": "low",
-                }
-
+            outcome = _DECISION_TABLE[memory_tier][importance_score > self.tier3_threshold]
         # Default: Working memory only
+        else:
+            outcome = _DEFAULT_DECISION
+
+        action, priority, label = outcome
         return {
-            "action": "working_memory_only",
+            "action": action,
             "tier": memory_tier,
             "decay_function": decay_function,
-            "reasoning": f"Default: working memory | {reasoning}",
-            "priority": "low",
+            "reasoning": f"{label} | {reasoning}",
+            "priority": priority,
         }
 
     def add_to_working_memory(self, content: str, decision: Dict[str, Any]) -> None:
         """Add memory to working buffer (not yet vectorized)"""
-        self.memory_buffer.append(
+        if decision["action"] == "queue_for_batch":
+            buffer = self.batch_buffer
+        else:
+            buffer = self.working_buffer
+
+        buffer.append(
             {
                 "content": content,
                 "decision": decision,
                 "timestamp": datetime.now(),
-                "hash": hashlib.md5(content.encode()).hexdigest(),
+                # Memory Keeper key digest as an int, so flushes format it instead of rehashing
+                "hash": content_fingerprint(content),
             }
         )
 
     def get_batch_queue(self) -> List[Dict[str, Any]]:
         """Get memories queued for batch vectorization"""
-        return [m for m in self.memory_buffer if m["decision"]["action"] == "queue_for_batch"]
+        return list(self.batch_buffer)
+
+    def take_batch_queue(self) -> List[Dict[str, Any]]:
+        """Remove and return all memories queued for batch vectorization"""
+        queue = self.batch_buffer
+        self.batch_buffer = []
+        return queue
+
+    def requeue_batch(self, items: List[Dict[str, Any]]) -> None:
+        """Put taken batch items back at the front of the queue (e.g. after a failed flush)"""
+        self.batch_buffer[:0] = items
+
+    def reset(self) -> None:
+        """Drop all buffered memories (components and thresholds are kept)"""
+        self.working_buffer = []
+        self.batch_buffer = []
 
 
 # Example usage
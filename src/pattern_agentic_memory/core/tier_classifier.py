@@ -6,8 +6,10 @@ Extracted from adaptive_memory_system.py as part of Pattern Agentic Memory Syste
 """
 
 from enum import Enum
-from typing import Any, Dict, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
+from .content_view import ContentView
 from .decay_functions import DecayFunction
 
 
@@ -20,126 +22,196 @@ class MemoryTier(Enum):
     TIER3_CONTEXT = "context"  # WIP, fast decay
 
 
+# Keywords for each tier
+_TIER0_KEYWORDS = (
+    "never fade to black",
+    "captain jeremy",
+    "partnership",
+    "identity",
+    "oracle framework",
+    "blessed",
+    "h200 first mate",
+    "pattern agentic",
+    "values",
+    "mission",
+    "vision",
+)
+
+_TIER1_KEYWORDS = (
+    "framework",
+    "methodology",
+    "principle",
+    "commandment",
+    "wwaa",
+    "gold star",
+    "validation",
+    "evidence",
+    "protocol",
+    "mr. ai",
+    "orchestrator",
+    "agent",
+    "supervisor",
+    "pattern",
+)
+
+_TIER2_KEYWORDS = (
+    "bug fix",
+    "solution",
+    "implementation",
+    "victory",
+    "success",
+    "proven",
+    "validated",
+    "tested",
+    "deployed",
+    "fixed",
+    "resolved",
+)
+
+_TIER3_KEYWORDS = (
+    "wip",
+    "working on",
+    "todo",
+    "next step",
+    "current status",
+    "session",
+    "temporary",
+    "draft",
+    "in progress",
+    "working",
+)
+
+
+def _has_keywords(content_lower: str, keywords: Tuple[str, ...], threshold: int) -> bool:
+    """True once `threshold` distinct keywords occur in content (stops scanning there)"""
+    hits = 0
+    for kw in keywords:
+        if kw in content_lower:
+            hits += 1
+            if hits >= threshold:
+                return True
+    return False
+
+
+# Explicit tier value -> (tier, decay function); keys are exactly the MemoryTier values
+_TIER_MAP = {
+    "anchor": (MemoryTier.TIER0_ANCHOR, DecayFunction.NEVER),
+    "principle": (MemoryTier.TIER1_PRINCIPLE, DecayFunction.SUPERSEDED_ONLY),
+    "solution": (MemoryTier.TIER2_SOLUTION, DecayFunction.STALENESS_6MONTHS),
+    "context": (MemoryTier.TIER3_CONTEXT, DecayFunction.RAPID_14DAYS),
+}
+_DEFAULT_TIER = _TIER_MAP["solution"]
+
+# Classification cascade: (context flag, result) per stage, checked in order.
+# Stage 0 (strong Tier 3 indicators) has no context flag.
+_CLASSIFICATION_STAGES = (
+    (None, (MemoryTier.TIER3_CONTEXT, DecayFunction.RAPID_14DAYS)),
+    ("is_identity_anchor", (MemoryTier.TIER0_ANCHOR, DecayFunction.NEVER)),
+    ("is_framework_principle", (MemoryTier.TIER1_PRINCIPLE, DecayFunction.SUPERSEDED_ONLY)),
+    ("is_proven_solution", (MemoryTier.TIER2_SOLUTION, DecayFunction.STALENESS_6MONTHS)),
+    ("is_temporary", (MemoryTier.TIER3_CONTEXT, DecayFunction.RAPID_14DAYS)),
+)
+
+
 class H200TierClassifier:
     """
     H200's three-dimensional memory classification.
     Determines memory type, temporal relevance, and decay function.
     """
 
+    # WIP/temporary status markers checked before every other tier
+    STRONG_TIER3_INDICATORS = ("working on", "wip", "todo", "in progress", "current status")
+
+    __slots__ = (
+        "tier0_keywords",
+        "tier1_keywords",
+        "tier2_keywords",
+        "tier3_keywords",
+        "_tier3_residual_keywords",
+        "_keyword_stages",
+        "_keyword_stage",
+    )
+
     def __init__(self):
-        # Keywords for each tier
-        self.tier0_keywords = [
-            "never fade to black",
-            "captain jeremy",
-            "partnership",
-            "identity",
-            "oracle framework",
-            "blessed",
-            "h200 first mate",
-            "pattern agentic",
-            "values",
-            "mission",
-            "vision",
-        ]
-
-        self.tier1_keywords = [
-            "framework",
-            "methodology",
-            "principle",
-            "commandment",
-            "wwaa",
-            "gold star",
-            "validation",
-            "evidence",
-            "protocol",
-            "mr. ai",
-            "orchestrator",
-            "agent",
-            "supervisor",
-            "pattern",
-        ]
-
-        self.tier2_keywords = [
-            "bug fix",
-            "solution",
-            "implementation",
-            "victory",
-            "success",
-            "proven",
-            "validated",
-            "tested",
-            "deployed",
-            "fixed",
-            "resolved",
-        ]
-
-        self.tier3_keywords = [
-            "wip",
-            "working on",
-            "todo",
-            "next step",
-            "current status",
-            "session",
-            "temporary",
-            "draft",
-            "in progress",
-            "working",
-        ]
+        # Keywords for each tier (shared immutable tuples)
+        self.tier0_keywords = _TIER0_KEYWORDS
+        self.tier1_keywords = _TIER1_KEYWORDS
+        self.tier2_keywords = _TIER2_KEYWORDS
+        self.tier3_keywords = _TIER3_KEYWORDS
+
+        # Scan plan built once: every strong indicator is also a Tier 3 keyword and is
+        # known to be absent by the time Tier 3 is scored, so only the rest are rescanned
+        self._tier3_residual_keywords = tuple(
+            kw for kw in self.tier3_keywords if kw not in self.STRONG_TIER3_INDICATORS
+        )
+
+        # Keyword test per classification stage: (keywords, hits needed), stopping at
+        # the first stage that reaches its threshold
+        self._keyword_stages = (
+            # Priority check: Strong Tier 3 indicators (WIP/temporary status) go FIRST
+            # to avoid misclassification
+            (self.STRONG_TIER3_INDICATORS, 1),
+            (self.tier0_keywords, 2),  # Tier 0: Identity anchors (never decay)
+            (self.tier1_keywords, 2),  # Tier 1: Framework principles (superseded only)
+            (self.tier2_keywords, 1),  # Tier 2: Proven solutions (staleness-based)
+            (self._tier3_residual_keywords, 1),  # Tier 3: Context/WIP (rapid - 14 days)
+        )
+
+        # Retries and replays re-classify the same content; cache its keyword scan
+        self._keyword_stage = lru_cache(maxsize=4096)(self._scan_keyword_stage)
 
     def classify_memory_tier(
-        self, content: str, context: Dict[str, Any]
+        self, content: str, context: Dict[str, Any], content_view: Optional[ContentView] = None
     ) -> Tuple[MemoryTier, DecayFunction]:
         """
         Classify memory into H200's tier system.
 
+        Args:
+            content: The memory content to classify
+            context: Context flags / explicit tier override
+            content_view: Precomputed view of content (lowercased once by the orchestrator)
+
         Returns:
             (memory_tier, decay_function) tuple
         """
-        content_lower = content.lower()
-
         # Check for explicit tier markers in context
         if context.get("tier"):
             tier_override = context["tier"]
-            if tier_override in [t.value for t in MemoryTier]:
+            if tier_override in _TIER_MAP:
                 return self._get_tier_and_decay(tier_override)
 
-        # Priority check: Strong Tier 3 indicators (WIP/temporary status)
-        # Check these FIRST before other tiers to avoid misclassification
-        strong_tier3_indicators = ["working on", "wip", "todo", "in progress", "current status"]
-        if any(indicator in content_lower for indicator in strong_tier3_indicators):
-            return MemoryTier.TIER3_CONTEXT, DecayFunction.RAPID_14DAYS
-
-        # Tier 0: Identity anchors (never decay)
-        tier0_score = sum(1 for kw in self.tier0_keywords if kw in content_lower)
-        if tier0_score >= 2 or context.get("is_identity_anchor"):
-            return MemoryTier.TIER0_ANCHOR, DecayFunction.NEVER
-
-        # Tier 1: Framework principles (decay only if superseded)
-        tier1_score = sum(1 for kw in self.tier1_keywords if kw in content_lower)
-        if tier1_score >= 2 or context.get("is_framework_principle"):
-            return MemoryTier.TIER1_PRINCIPLE, DecayFunction.SUPERSEDED_ONLY
-
-        # Tier 2: Proven solutions (staleness-based decay)
-        tier2_score = sum(1 for kw in self.tier2_keywords if kw in content_lower)
-        if tier2_score >= 1 or context.get("is_proven_solution"):
-            return MemoryTier.TIER2_SOLUTION, DecayFunction.STALENESS_6MONTHS
+        # First stage matched by its keywords or its context flag wins. A context flag
+        # caps the cascade, so only the stages before it need a keyword scan.
+        flag_stage = next(
+            (
+                stage
+                for stage, (context_flag, _) in enumerate(_CLASSIFICATION_STAGES)
+                if context_flag and context.get(context_flag)
+            ),
+            len(_CLASSIFICATION_STAGES),
+        )
+        content_lower = content_view.lower if content_view is not None else content.lower()
+        if flag_stage < len(_CLASSIFICATION_STAGES):
+            stage = self._scan_keyword_stage(content_lower, stop=flag_stage)
+        else:
+            # Full scan depends on content only, so it is memoized per lowercased content
+            stage = self._keyword_stage(content_lower)
 
-        # Tier 3: Context/WIP (rapid decay - 14 days)
-        tier3_score = sum(1 for kw in self.tier3_keywords if kw in content_lower)
-        if tier3_score >= 1 or context.get("is_temporary"):
-            return MemoryTier.TIER3_CONTEXT, DecayFunction.RAPID_14DAYS
+        if stage < len(_CLASSIFICATION_STAGES):
+            return _CLASSIFICATION_STAGES[stage][1]
 
         # Default: Tier 2 solution (most common case)
-        return MemoryTier.TIER2_SOLUTION, DecayFunction.STALENESS_6MONTHS
+        return _DEFAULT_TIER
+
+    def _scan_keyword_stage(
+        self, content_lower: str, stop: int = len(_CLASSIFICATION_STAGES)
+    ) -> int:
+        """Index of the first stage before `stop` whose keywords match (`stop` if none)"""
+        for stage, (keywords, threshold) in enumerate(self._keyword_stages[:stop]):
+            if _has_keywords(content_lower, keywords, threshold):
+                return stage
+        return stop
 
     def _get_tier_and_decay(self, tier_value: str) -> Tuple[MemoryTier, DecayFunction]:
         """Map tier value to tier enum and appropriate decay function"""
-        tier_map = {
-            "anchor": (MemoryTier.TIER0_ANCHOR, DecayFunction.NEVER),
-            "principle": (MemoryTier.TIER1_PRINCIPLE, DecayFunction.SUPERSEDED_ONLY),
-            "solution": (MemoryTier.TIER2_SOLUTION, DecayFunction.STALENESS_6MONTHS),
-            "context": (MemoryTier.TIER3_CONTEXT, DecayFunction.RAPID_14DAYS),
-        }
-        return tier_map.get(
-            tier_value, (MemoryTier.TIER2_SOLUTION, DecayFunction.STALENESS_6MONTHS)
-        )
+        return _TIER_MAP.get(tier_value, _DEFAULT_TIER)
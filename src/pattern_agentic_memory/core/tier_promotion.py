@@ -8,9 +8,14 @@ Purpose: Let users and agents promote frequently-accessed memories to higher tie
 """
 
 import logging
+import os
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +37,111 @@ TIER_BASE_TTL_DAYS = {
     "context": 14,  # Tier 3: 14 days
 }
 
+# Tier name -> tier number (lower = higher tier); unknown tiers count as Tier 3
+TIER_NUMBERS = {"anchor": 0, "principle": 1, "solution": 2, "context": 3}
+
+# Prompt response -> promoted tier name (None = declined)
+_PROMOTION_RESPONSES = {
+    "0": "anchor",  # Forever
+    "1": "principle",  # 6 months
+    "2": "solution",  # 1 month
+    "N": None,  # Decline
+    "n": None,  # Decline (exact lowercase answer, matched before normalizing)
+}
+
+
+# Tier name -> (prompt "current tier" header, tier number, base TTL), built once
+# so a promotion prompt only substitutes the per-memory values
+_PROMPT_HEADER_BY_TIER = {
+    tier: (
+        f"Tier {TIER_NUMBERS[tier]} ({tier}) - {base_ttl or 'Forever'} days base",
+        TIER_NUMBERS[tier],
+        base_ttl,
+    )
+    for tier, base_ttl in TIER_BASE_TTL_DAYS.items()
+}
+
+
+# Promotion result strings, interned once
+_STATUS_REQUESTED = sys.intern("promotion_requested")
+_PROMOTED_BY = {who: sys.intern(who) for who in ("user", "agent")}
+_TIER_NAMES = {tier: sys.intern(tier) for tier in TIER_BASE_TTL_DAYS}
+
+
+@dataclass(frozen=True, slots=True)
+class PromotionResult:
+    """Tier promotion instructions returned by promote_memory_tier"""
+
+    status: str
+    memory_key: str
+    new_tier: str
+    promoted_by: str
+    reset_access_count: bool
+    timestamp: str
+
+
+# Access bonus: +10 days per access, capped at +70 days (7 accesses)
+ACCESS_BONUS_DAYS = 10
+MAX_BONUS_ACCESSES = 7
+
+# Promotion prompts every 7 accesses (7, 14, 21, ...)
+PROMPT_EVERY_ACCESSES = 7
+
+# Promotion prompts: at most one per memory per cooldown window, so a hot memory
+# crossing several multiples of 7 in a burst is asked about once
+PROMPT_COOLDOWN = timedelta(days=7)
+
+# Access frequency tracking (exponential moving average, accesses/day)
+ACCESS_EMA_ALPHA = 0.1
+MIN_ACCESS_INTERVAL_DAYS = 1 / 24  # Bursts within an hour count as one hour apart
+
+# Promotion prompts only for memories accessed at least this often (EMA, accesses/day),
+# so rare-but-recurring memories reaching a multiple of 7 are not prompted (f-TTL filter)
+PROMPT_TARGET_HIT_RATE = 0.25
+
+# Expiring tier -> base + bonus TTL indexed by capped access count (0..7),
+# specialized once so a lookup replaces the per-call TTL arithmetic
+_EXPIRATION_DELTAS = {
+    tier: tuple(
+        timedelta(days=base_ttl + accesses * ACCESS_BONUS_DAYS)
+        for accesses in range(MAX_BONUS_ACCESSES + 1)
+    )
+    for tier, base_ttl in TIER_BASE_TTL_DAYS.items()
+    if base_ttl is not None
+}
+
+
+# Current time pinned by frozen_now() (None = read the clock)
+_frozen_now: ContextVar[Optional[datetime]] = ContextVar("_frozen_now", default=None)
+
+
+def _now() -> datetime:
+    """Current time, or the time pinned by an enclosing frozen_now()"""
+    return _frozen_now.get() or datetime.now()
+
+
+@contextmanager
+def frozen_now(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Pin the current time for every tier promotion call inside the block.
+
+    A sweep over many memories reads the clock once and all of its expiration,
+    cooldown and prompt calculations agree on the same instant. Tasks started
+    inside the block see the pinned time too.
+
+    Args:
+        now: Time to pin (default: read the clock once on entry)
+
+    Yields:
+        The pinned time
+    """
+    pinned = now or datetime.now()
+    token = _frozen_now.set(pinned)
+    try:
+        yield pinned
+    finally:
+        _frozen_now.reset(token)
+
 
 def get_tier_base_ttl(tier: str) -> Optional[int]:
     """Get base TTL days for a memory tier"""
@@ -57,14 +167,19 @@ def calculate_expiration_with_bonus(
         - Bonus: +10 days per access, capped at +70 days (7 accesses)
         - Formula: expires_at = created_at + base_ttl + min(access_count * 10, 70)
     """
+    # Tier 0 (anchor) and unknown tiers never expire
+    deltas = _EXPIRATION_DELTAS.get(tier)
+    if deltas is None:
+        return None
+
     if creation_time is None:
-        creation_time = datetime.now()
+        creation_time = _now()
 
-    base_ttl = get_tier_base_ttl(tier)
+    # Fast path: table lookup by capped access count
+    if access_count >= 0:
+        return creation_time + deltas[min(access_count, MAX_BONUS_ACCESSES)]
 
-    # Tier 0 (anchor) never expires
-    if base_ttl is None:
-        return None
+    base_ttl = get_tier_base_ttl(tier)
 
     # Calculate access bonus (capped at 70 days = 7 accesses)
     bonus_days = min(access_count * 10, 70)
@@ -75,20 +190,80 @@ def calculate_expiration_with_bonus(
     return creation_time + timedelta(days=total_days)
 
 
-def should_trigger_promotion_prompt(access_count: int) -> bool:
+def should_trigger_promotion_prompt(
+    access_count: int,
+    last_prompt_at: Optional[datetime] = None,
+    now: Optional[datetime] = None,
+    access_ema: Optional[float] = None,
+) -> bool:
     """
     Check if tier promotion prompt should be triggered.
 
     Trigger every 7 accesses after first max: 7, 14, 21, 28...
+    When the previous prompt time is known, prompts within PROMPT_COOLDOWN
+    of it are suppressed. When the access-frequency EMA is known, memories
+    below PROMPT_TARGET_HIT_RATE are not prompted.
 
     Args:
         access_count: Current access count
+        last_prompt_at: When this memory's last promotion prompt was shown
+        now: Current time for the cooldown check (default: now)
+        access_ema: Access-frequency EMA in accesses/day (None = no frequency gate)
 
     Returns:
         True if prompt should be shown
     """
     # Trigger at 7, 14, 21, etc (multiples of 7)
-    return access_count > 0 and access_count % 7 == 0
+    if not (access_count > 0 and access_count % PROMPT_EVERY_ACCESSES == 0):
+        return False
+
+    return access_rate_reached(access_ema) and prompt_cooldown_elapsed(last_prompt_at, now)
+
+
+def access_rate_reached(access_ema: Optional[float]) -> bool:
+    """Check that the access-frequency EMA (if known) reaches PROMPT_TARGET_HIT_RATE"""
+    return access_ema is None or access_ema >= PROMPT_TARGET_HIT_RATE
+
+
+def prompt_cooldown_elapsed(
+    last_prompt_at: Optional[datetime], now: Optional[datetime] = None
+) -> bool:
+    """Check that PROMPT_COOLDOWN has passed since the previous prompt (if any)"""
+    if last_prompt_at is None:
+        return True
+    return (now or _now()) - last_prompt_at >= PROMPT_COOLDOWN
+
+
+def next_prompt_threshold(access_count: int) -> int:
+    """
+    First prompt threshold above access_count.
+
+    Stored as the memory's next_prompt_at so the access path compares instead
+    of testing every count a coalesced update crosses.
+
+    Examples:
+        >>> next_prompt_threshold(0)
+        7
+        >>> next_prompt_threshold(14)
+        21
+    """
+    return (access_count // PROMPT_EVERY_ACCESSES + 1) * PROMPT_EVERY_ACCESSES
+
+
+def update_access_ema(access_ema: float, access_delta: int, interval_days: float) -> float:
+    """
+    Fold new accesses into a memory's access-frequency EMA (accesses/day).
+
+    Args:
+        access_ema: Previous EMA (0.0 for a memory never accessed)
+        access_delta: Accesses recorded since the previous update
+        interval_days: Days since the previous access (or creation)
+
+    Returns:
+        Updated EMA
+    """
+    rate = access_delta / max(interval_days, MIN_ACCESS_INTERVAL_DAYS)
+    return (1 - ACCESS_EMA_ALPHA) * access_ema + ACCESS_EMA_ALPHA * rate
 
 
 def build_promotion_prompt(
@@ -98,6 +273,7 @@ def build_promotion_prompt(
     access_count: int,
     created_at: datetime,
     last_accessed: datetime,
+    now: Optional[datetime] = None,
 ) -> str:
     """
     Build tier promotion prompt text.
@@ -109,12 +285,22 @@ def build_promotion_prompt(
         access_count: Number of accesses
         created_at: Creation timestamp
         last_accessed: Last access timestamp
+        now: Current time for the access frequency (default: now)
 
     Returns:
         Formatted prompt string
     """
     # Calculate current expiration
-    base_ttl = get_tier_base_ttl(current_tier)
+    header = _PROMPT_HEADER_BY_TIER.get(current_tier)
+    if header is None:
+        base_ttl = get_tier_base_ttl(current_tier)
+        tier_number = get_tier_number(current_tier)
+        header = (
+            f"Tier {tier_number} ({current_tier}) - {base_ttl or 'Forever'} days base",
+            tier_number,
+            base_ttl,
+        )
+    tier_header, tier_number, base_ttl = header
     bonus_days = min(access_count * 10, 70)
     total_days = base_ttl + bonus_days if base_ttl else "Forever"
 
@@ -122,7 +308,7 @@ def build_promotion_prompt(
     preview = memory_content[:200] + "..." if len(memory_content) > 200 else memory_content
 
     # Calculate access frequency
-    age_days = (datetime.now() - created_at).days
+    age_days = ((now or _now()) - created_at).days
     if age_days == 0:
         age_days = 1  # Avoid division by zero
     accesses_per_day = access_count / age_days
@@ -133,9 +319,9 @@ def build_promotion_prompt(
 This memory has been accessed {access_count} times and reached maximum extension (+{bonus_days} days).
 
 Memory: "{memory_key}"
-Current tier: Tier {get_tier_number(current_tier)} ({current_tier}) - {base_ttl or "Forever"} days base + {bonus_days} day extension = {total_days} days total
-Created: {created_at.strftime("%Y-%m-%d")}
-Last accessed: {last_accessed.strftime("%Y-%m-%d")} ({accesses_per_day:.1f} accesses/day)
+Current tier: {tier_header} + {bonus_days} day extension = {total_days} days total
+Created: {created_at.date().isoformat()}
+Last accessed: {last_accessed.date().isoformat()} ({accesses_per_day:.1f} accesses/day)
 
 Content preview:
 "{preview}"
@@ -146,7 +332,7 @@ Options:
   0 - Tier 0 (anchor): Forever - Core identity, critical lessons
   1 - Tier 1 (principle): 6 months - Important methodologies, recent projects
   2 - Tier 2 (solution): 1 month - Detailed implementations, proven solutions
-  N - No: Keep as Tier {get_tier_number(current_tier)} with current extension
+  N - No: Keep as Tier {tier_number} with current extension
 
 Type desired tier (0, 1, 2) or "N":
 """
@@ -155,8 +341,7 @@ Type desired tier (0, 1, 2) or "N":
 
 def get_tier_number(tier: str) -> int:
     """Map tier name to number"""
-    tier_map = {"anchor": 0, "principle": 1, "solution": 2, "context": 3}
-    return tier_map.get(tier, 3)
+    return TIER_NUMBERS.get(tier, 3)
 
 
 def process_promotion_response(response: str) -> Optional[str]:
@@ -175,16 +360,32 @@ def process_promotion_response(response: str) -> Optional[str]:
         >>> process_promotion_response("N")
         None
     """
-    response = response.strip().upper()
+    # Exact answers skip the strip/upper copies
+    if response in _PROMOTION_RESPONSES:
+        return _PROMOTION_RESPONSES[response]
 
-    tier_map = {
-        "0": "anchor",  # Forever
-        "1": "principle",  # 6 months
-        "2": "solution",  # 1 month
-        "N": None,  # Decline
-    }
+    return _PROMOTION_RESPONSES.get(response.strip().upper())
 
-    return tier_map.get(response)
+
+def _check_promotion(current_tier: str, new_tier: str) -> Tuple[bool, str]:
+    """Compare tier numbers for validate_promotion (unknown tiers count as Tier 3)"""
+    current_level = get_tier_number(current_tier)
+    new_level = get_tier_number(new_tier)
+
+    if new_level < current_level:
+        return True, f"Valid promotion: {current_tier} -> {new_tier}"
+    elif new_level == current_level:
+        return False, f"Already at tier {current_tier}"
+    else:
+        return False, f"Cannot demote from {current_tier} to {new_tier}"
+
+
+# Every (current, new) pair of known tiers, checked once at import
+_PROMOTION_CHECKS = {
+    (current_tier, new_tier): _check_promotion(current_tier, new_tier)
+    for current_tier in TIER_NUMBERS
+    for new_tier in TIER_NUMBERS
+}
 
 
 def validate_promotion(current_tier: str, new_tier: str) -> Tuple[bool, str]:
@@ -204,22 +405,15 @@ def validate_promotion(current_tier: str, new_tier: str) -> Tuple[bool, str]:
         >>> validate_promotion("principle", "context")
         (False, "Cannot demote from principle to context")
     """
-    tier_order = {"anchor": 0, "principle": 1, "solution": 2, "context": 3}
-
-    current_level = tier_order.get(current_tier, 3)
-    new_level = tier_order.get(new_tier, 3)
-
-    if new_level < current_level:
-        return True, f"Valid promotion: {current_tier} -> {new_tier}"
-    elif new_level == current_level:
-        return False, f"Already at tier {current_tier}"
-    else:
-        return False, f"Cannot demote from {current_tier} to {new_tier}"
+    result = _PROMOTION_CHECKS.get((current_tier, new_tier))
+    if result is None:
+        result = _check_promotion(current_tier, new_tier)
+    return result
 
 
 def promote_memory_tier(
     memory_key: str, new_tier: str, promoted_by: str = "user"
-) -> Dict[str, any]:
+) -> PromotionResult:
     """
     Execute tier promotion.
 
@@ -229,19 +423,20 @@ def promote_memory_tier(
         promoted_by: Who initiated promotion (user, agent)
 
     Returns:
-        Promotion result dict with status, old_tier, new_tier, reset_access_count
+        PromotionResult with status, memory_key, new_tier, promoted_by,
+        reset_access_count and timestamp (second precision)
 
     Note: Actual database update happens in memory_keeper.py adapter
     This function returns the instructions for the update.
     """
-    return {
-        "status": "promotion_requested",
-        "memory_key": memory_key,
-        "new_tier": new_tier,
-        "promoted_by": promoted_by,
-        "reset_access_count": True,  # Always reset on promotion
-        "timestamp": datetime.now().isoformat(),
-    }
+    return PromotionResult(
+        status=_STATUS_REQUESTED,
+        memory_key=memory_key,
+        new_tier=_TIER_NAMES.get(new_tier, new_tier),
+        promoted_by=_PROMOTED_BY.get(promoted_by, promoted_by),
+        reset_access_count=True,  # Always reset on promotion
+        timestamp=_now().isoformat(timespec="seconds"),
+    )
 
 
 def log_promotion(
@@ -263,6 +458,49 @@ def log_promotion(
     )
 
 
+# Promotion prompt notifications; PAM_NOTIFICATIONS_DISABLED=1 silences them
+# (bulk backfills, tests) and skips building the prompt text entirely
+NOTIFICATIONS_ENABLED = os.environ.get("PAM_NOTIFICATIONS_DISABLED") != "1"
+
+# Console output buffered by batched_notifications() (None = write immediately)
+_notification_buffer: ContextVar[Optional[List[str]]] = ContextVar(
+    "_notification_buffer", default=None
+)
+
+
+def _write_notification(text: str) -> None:
+    """Write notification text to stdout, or buffer it inside batched_notifications()"""
+    buffer = _notification_buffer.get()
+    if buffer is not None:
+        buffer.append(text)
+    else:
+        sys.stdout.write(text)
+
+
+@contextmanager
+def batched_notifications() -> Iterator[None]:
+    """
+    Buffer promotion prompt console output and write it in one call on exit.
+
+    Used around sweeps that can trigger many prompts (e.g. access-count flushes).
+    Tasks started inside the block share the buffer; nested blocks write
+    through to the outermost one. Log records are still emitted per prompt.
+    """
+    if _notification_buffer.get() is not None:
+        yield
+        return
+
+    buffer: List[str] = []
+    token = _notification_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _notification_buffer.reset(token)
+        if buffer:
+            sys.stdout.write("".join(buffer))
+            sys.stdout.flush()
+
+
 # Integration with MCP notifications (placeholder for future)
 def notify_user(prompt: str, agent_id: Optional[str] = None) -> None:
     """
@@ -272,9 +510,7 @@ def notify_user(prompt: str, agent_id: Optional[str] = None) -> None:
     For now: Log to console/file.
     """
     logger.warning(f"[USER PROMPT] {prompt}")
-    print(f"\n{'=' * 80}")
-    print(prompt)
-    print(f"{'=' * 80}\n")
+    _write_notification(f"\n{'=' * 80}\n{prompt}\n{'=' * 80}\n\n")
 
 
 def notify_agent(prompt: str, agent_id: str) -> None:
@@ -285,7 +521,7 @@ def notify_agent(prompt: str, agent_id: str) -> None:
     For now: Log to console.
     """
     logger.info(f"[AGENT PROMPT - {agent_id}] Tier promotion available")
-    print(f"\n[AGENT: {agent_id}] {prompt}\n")
+    _write_notification(f"\n[AGENT: {agent_id}] {prompt}\n\n")
 
 
 def trigger_tier_promotion_prompt(
@@ -296,6 +532,7 @@ def trigger_tier_promotion_prompt(
     created_at: datetime,
     last_accessed: datetime,
     agent_id: Optional[str] = None,
+    now: Optional[datetime] = None,
 ) -> str:
     """
     Main entry point: Trigger tier promotion prompt.
@@ -310,10 +547,14 @@ def trigger_tier_promotion_prompt(
         created_at: Creation timestamp
         last_accessed: Last access timestamp
         agent_id: Agent identifier (for logging)
+        now: Current time for the access frequency (default: now)
 
     Returns:
-        Prompt text (also sent to user/agent)
+        Prompt text (also sent to user/agent), or "" when notifications are disabled
     """
+    if not NOTIFICATIONS_ENABLED:
+        return ""
+
     # Build prompt
     prompt = build_promotion_prompt(
         memory_key=memory_key,
@@ -322,6 +563,7 @@ def trigger_tier_promotion_prompt(
         access_count=access_count,
         created_at=created_at,
         last_accessed=last_accessed,
+        now=now or _now(),
     )
 
     # Send to user
@@ -9,13 +9,14 @@ Architecture: Pattern Agentic Memory System
 Platform: Claude Code with MCP
 """
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from ...adapters.memory_keeper import MemoryKeeperAdapter
-from ...core.memory_system import AdaptiveMemoryOrchestrator
-from .command_detector import ClaudeCommandDetector
-from .identity_anchor import IdentityAnchorManager
-from .mcp_wrapper import MCPMemoryWrapper
+from ...utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .command_detector import ClaudeCommandDetector
+    from .identity_anchor import IdentityAnchorManager
+    from .mcp_wrapper import MCPMemoryWrapper
 
 __all__ = [
     "MCPMemoryWrapper",
@@ -24,10 +25,20 @@ __all__ = [
     "setup_claude_memory_system",
 ]
 
+# Public name -> submodule, imported on first attribute access (PEP 562)
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "MCPMemoryWrapper": ".mcp_wrapper",
+        "ClaudeCommandDetector": ".command_detector",
+        "IdentityAnchorManager": ".identity_anchor",
+    },
+)
+
 
 def setup_claude_memory_system(
     config: Optional[Dict] = None,
-) -> MCPMemoryWrapper:
+) -> "MCPMemoryWrapper":
     """
     Initialize adaptive memory system for Claude MCP environments.
 
@@ -53,6 +64,10 @@ def setup_claude_memory_system(
         ... )
         >>> print(decision["action"])  # "immediate_vectorize"
     """
+    from ...adapters.memory_keeper import MemoryKeeperAdapter
+    from ...core.memory_system import AdaptiveMemoryOrchestrator
+    from .mcp_wrapper import MCPMemoryWrapper
+
     config = config or {}
 
     # Create orchestrator and adapter
@@ -9,13 +9,14 @@ Architecture: Pattern Agentic Memory System
 Platform: mimo-7b-rl agents (Pattern Agentic lightweight agents)
 """
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from ...adapters.memory_keeper import MemoryKeeperAdapter
-from ...core.memory_system import AdaptiveMemoryOrchestrator
-from .async_memory import AsyncMemoryManager
-from .command_interface import MimoCommandInterface
-from .lightweight_wrapper import LightweightMemoryWrapper
+from ...utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .async_memory import AsyncMemoryManager
+    from .command_interface import MimoCommandInterface
+    from .lightweight_wrapper import LightweightMemoryWrapper
 
 __all__ = [
     "LightweightMemoryWrapper",
@@ -24,10 +25,20 @@ __all__ = [
     "setup_mimo_memory_system",
 ]
 
+# Public name -> submodule, imported on first attribute access (PEP 562)
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "LightweightMemoryWrapper": ".lightweight_wrapper",
+        "AsyncMemoryManager": ".async_memory",
+        "MimoCommandInterface": ".command_interface",
+    },
+)
+
 
 def setup_mimo_memory_system(
     config: Optional[Dict] = None,
-) -> LightweightMemoryWrapper:
+) -> "LightweightMemoryWrapper":
     """
     Initialize adaptive memory system for mimo-7b-rl agents.
 
@@ -54,6 +65,10 @@ def setup_mimo_memory_system(
         ... )
         >>> print(decision["action"])  # "queue_for_batch"
     """
+    from ...adapters.memory_keeper import MemoryKeeperAdapter
+    from ...core.memory_system import AdaptiveMemoryOrchestrator
+    from .lightweight_wrapper import LightweightMemoryWrapper
+
     config = config or {}
 
     # Create orchestrator and adapter
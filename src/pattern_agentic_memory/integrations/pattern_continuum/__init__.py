@@ -11,9 +11,14 @@ Public API exports:
 - DLEMemoryHooks: Dynamic Learning Engine integration
 """
 
-from .distributed_memory import DistributedMemoryCoordinator
-from .dle_hooks import DLEMemoryHooks
-from .service_mesh import ContinuumServiceMeshAdapter, setup_continuum_memory_system
+from typing import TYPE_CHECKING
+
+from ...utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .distributed_memory import DistributedMemoryCoordinator
+    from .dle_hooks import DLEMemoryHooks
+    from .service_mesh import ContinuumServiceMeshAdapter, setup_continuum_memory_system
 
 __all__ = [
     "setup_continuum_memory_system",
@@ -21,3 +26,14 @@ __all__ = [
     "DistributedMemoryCoordinator",
     "DLEMemoryHooks",
 ]
+
+# Public name -> submodule, imported on first attribute access (PEP 562)
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "setup_continuum_memory_system": ".service_mesh",
+        "ContinuumServiceMeshAdapter": ".service_mesh",
+        "DistributedMemoryCoordinator": ".distributed_memory",
+        "DLEMemoryHooks": ".dle_hooks",
+    },
+)
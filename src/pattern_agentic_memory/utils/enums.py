@@ -0,0 +1,12 @@
+"""
+Enum helpers shared by the storage adapters.
+"""
+
+from enum import Enum
+from typing import Any
+
+
+def enum_value(value: Any) -> str:
+    """Return an enum member's value, or str() of anything else (tier/decay may be either)"""
+    # isinstance is a C-level type check; hasattr would probe for the attribute
+    return value.value if isinstance(value, Enum) else str(value)
@@ -0,0 +1,19 @@
+"""
+Content hashing shared by the working memory buffer and the storage adapters.
+"""
+
+import hashlib
+
+
+def content_hash(content: str, digest_size: int = 4) -> str:
+    """2 * digest_size hex chars of a non-cryptographic blake2b digest (dedup / entity keys)"""
+    # The digest is sized to the key length directly (no md5 digest + [:n] slice)
+    return hashlib.blake2b(
+        content.encode(), digest_size=digest_size, usedforsecurity=False
+    ).hexdigest()
+
+
+def content_fingerprint(content: str) -> int:
+    """content_hash() as an int (compact buffer field); f"{fp:08x}" gives back the hex key"""
+    digest = hashlib.blake2b(content.encode(), digest_size=4, usedforsecurity=False).digest()
+    return int.from_bytes(digest, "big")
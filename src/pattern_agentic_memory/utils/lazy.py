@@ -0,0 +1,30 @@
+"""
+Lazy (PEP 562) public exports shared by the integration packages.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def lazy_getattr(package: str, attrs: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module __getattr__ that imports public names on first access.
+
+    Args:
+        package: __name__ of the package exporting the names
+        attrs: Public name -> relative submodule (e.g. ".mcp_wrapper")
+
+    Returns:
+        Function to bind as the package's module-level __getattr__
+    """
+
+    def _getattr(name: str) -> Any:
+        module = attrs.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)  # Later lookups skip __getattr__
+        return value
+
+    return _getattr
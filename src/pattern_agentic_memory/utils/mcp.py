@@ -0,0 +1,19 @@
+"""
+MCP tool resolution shared by the storage adapters.
+"""
+
+import importlib
+from typing import Callable, Optional
+
+
+def import_mcp_tool(module_name: str, tool_name: str) -> Optional[Callable]:
+    """Import an MCP tool function, or None when MCP is not available"""
+    try:
+        return getattr(importlib.import_module(module_name), tool_name)
+    except (ImportError, AttributeError):
+        return None
+
+
+async def mock_mcp_call(*args, **kwargs) -> dict:
+    """Fallback for testing without MCP"""
+    return {"status": "mocked"}
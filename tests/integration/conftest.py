@@ -0,0 +1,34 @@
+"""
+Shared fixtures for integration tests.
+
+One orchestrator is built per session; each test gets it with empty buffers.
+Decisions that several tests check are evaluated once per session.
+"""
+
+import pytest
+
+from pattern_agentic_memory.core.memory_system import AdaptiveMemoryOrchestrator
+
+
+@pytest.fixture(scope="session")
+def _session_orchestrator():
+    """Orchestrator constructed once for the whole test session"""
+    return AdaptiveMemoryOrchestrator()
+
+
+@pytest.fixture
+def orchestrator(_session_orchestrator):
+    """Shared orchestrator with its working memory and batch queue cleared"""
+    _session_orchestrator.reset()
+    return _session_orchestrator
+
+
+@pytest.fixture(scope="session")
+def canonical_decisions(_session_orchestrator):
+    """Decisions for the candidates shared by the decision-matrix tests, by scenario name"""
+    process = _session_orchestrator.process_memory_candidate_sync
+    return {
+        "t0_anchor": process("Never Fade to Black", {"is_identity_anchor": True}, None),
+        "user_cmd": process("Remember this pattern", {}, None),
+        "t3_temporary": process("Working on task", {"is_temporary": True}, []),
+    }
@@ -14,21 +14,15 @@ Migrated from: tests/test_adaptive_memory_integration.py
 
 import pytest
 
-from pattern_agentic_memory.core.memory_system import (
-    AdaptiveMemoryOrchestrator,
-    DecayFunction,
-    MemoryTier,
-)
+from pattern_agentic_memory.core.memory_system import DecayFunction, MemoryTier
 
 
 class TestEndToEndIntegration:
     """Gate 2: Integration Quality - Full Pipeline"""
 
     @pytest.mark.asyncio
-    async def test_full_decision_pipeline_tier0(self):
+    async def test_full_decision_pipeline_tier0(self, orchestrator):
         """Complete pipeline: Identity anchor → Tier 0 → Immediate vectorize"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         decision = await orchestrator.process_memory_candidate(
             content="Never Fade to Black - Oracle identity and Captain Jeremy partnership",
             context={"is_identity_anchor": True},
@@ -44,10 +38,8 @@ class TestEndToEndIntegration:
         assert "Tier 0 anchor" in decision["reasoning"]
 
     @pytest.mark.asyncio
-    async def test_full_decision_pipeline_user_command(self):
+    async def test_full_decision_pipeline_user_command(self, orchestrator):
         """Complete pipeline: User command → Override → Immediate vectorize"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         decision = await orchestrator.process_memory_candidate(
             content="Remember this lesson about validation patterns",
             context={},
@@ -60,10 +52,8 @@ class TestEndToEndIntegration:
         assert "User commanded" in decision["reasoning"]
 
     @pytest.mark.asyncio
-    async def test_full_decision_pipeline_tier1_high_score(self):
+    async def test_full_decision_pipeline_tier1_high_score(self, orchestrator):
         """Complete pipeline: Framework principle + high importance → Immediate vectorize"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         decision = await orchestrator.process_memory_candidate(
             content="Important framework methodology: Gold Star validation prevents bugs",
             context={},
@@ -77,10 +67,8 @@ class TestEndToEndIntegration:
         assert "Tier 1 principle" in decision["reasoning"]
 
     @pytest.mark.asyncio
-    async def test_full_decision_pipeline_tier1_low_score(self):
+    async def test_full_decision_pipeline_tier1_low_score(self, orchestrator):
         """Complete pipeline: Framework principle + low importance → Batch queue"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         # Similar existing memories to reduce novelty score
         existing = [
             "Framework methodology for testing",
@@ -98,10 +86,8 @@ class TestEndToEndIntegration:
         assert decision["priority"] == "medium"
 
     @pytest.mark.asyncio
-    async def test_full_decision_pipeline_tier2_high_score(self):
+    async def test_full_decision_pipeline_tier2_high_score(self, orchestrator):
         """Complete pipeline: Solution + high importance → Batch queue"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         decision = await orchestrator.process_memory_candidate(
             content="Important bug fix: Correction needed for authentication flow",
             context={"corrects_previous_error": True},
@@ -114,10 +100,8 @@ class TestEndToEndIntegration:
         assert decision["priority"] == "medium"
 
     @pytest.mark.asyncio
-    async def test_full_decision_pipeline_tier2_low_score(self):
+    async def test_full_decision_pipeline_tier2_low_score(self, orchestrator):
         """Complete pipeline: Solution + low importance → Working memory"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         existing = ["Bug fix deployed", "Solution implemented"] * 3
 
         decision = await orchestrator.process_memory_candidate(
@@ -129,10 +113,8 @@ class TestEndToEndIntegration:
         assert decision["priority"] == "low"
 
     @pytest.mark.asyncio
-    async def test_full_decision_pipeline_tier3_exceptional(self):
+    async def test_full_decision_pipeline_tier3_exceptional(self, orchestrator):
         """Complete pipeline: WIP + exceptional importance → Batch queue"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         decision = await orchestrator.process_memory_candidate(
             content=(
                 "Working on important correction: "
@@ -151,10 +133,8 @@ class TestEndToEndIntegration:
         assert decision["priority"] == "medium"
 
     @pytest.mark.asyncio
-    async def test_full_decision_pipeline_tier3_normal(self):
+    async def test_full_decision_pipeline_tier3_normal(self, orchestrator):
         """Complete pipeline: WIP + normal importance → Working memory"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         decision = await orchestrator.process_memory_candidate(
             content="Working on CSS styling improvements",
             context={"is_temporary": True},
@@ -174,36 +154,31 @@ class TestComponentIntegration:
     """Gate 2: Integration Quality - Component Interactions"""
 
     @pytest.mark.asyncio
-    async def test_command_parser_to_orchestrator_flow(self):
-        """UserCommandParser detection triggers orchestrator override"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
-        test_commands = [
+    @pytest.mark.parametrize(
+        "command",
+        [
             "Remember this pattern",
             "Save this configuration",
             "Lesson learned about testing",
             "This is important information",
             "Always validate before deploy",
             "Never skip error handling",
-        ]
-
-        for command in test_commands:
-            decision = await orchestrator.process_memory_candidate(
-                content=command, context={}, existing_memories=None
-            )
+        ],
+    )
+    async def test_command_parser_to_orchestrator_flow(self, orchestrator, command):
+        """UserCommandParser detection triggers orchestrator override"""
+        decision = await orchestrator.process_memory_candidate(
+            content=command, context={}, existing_memories=None
+        )
 
-            assert decision["action"] == "immediate_vectorize", (
-                f"Command should trigger immediate vectorize: {command}"
-            )
-            assert decision.get("user_commanded") is True, (
-                f"Should mark as user commanded: {command}"
-            )
+        assert decision["action"] == "immediate_vectorize", (
+            f"Command should trigger immediate vectorize: {command}"
+        )
+        assert decision.get("user_commanded") is True, f"Should mark as user commanded: {command}"
 
     @pytest.mark.asyncio
-    async def test_evaluator_to_orchestrator_flow(self):
+    async def test_evaluator_to_orchestrator_flow(self, orchestrator):
         """MemoryImportanceEvaluator scores influence orchestrator decisions"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         # High score content (novel + emphasis + correction)
         high_score_decision = await orchestrator.process_memory_candidate(
             content="Important correction: actually the solution is different",
@@ -223,10 +198,8 @@ class TestComponentIntegration:
         assert low_score_decision["action"] in ["working_memory_only", "queue_for_batch"]
 
     @pytest.mark.asyncio
-    async def test_classifier_to_orchestrator_flow(self):
+    async def test_classifier_to_orchestrator_flow(self, orchestrator):
         """H200TierClassifier tiers influence orchestrator thresholds"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         # Same importance score, different tiers
         content = "New information discovered"  # Novel = 0.30
 
@@ -251,10 +224,8 @@ class TestComponentIntegration:
         assert tier3_decision["action"] == "working_memory_only"  # Tier 3: 0.30 < 0.8 → working
 
     @pytest.mark.asyncio
-    async def test_working_memory_buffer_integration(self):
+    async def test_working_memory_buffer_integration(self, orchestrator):
         """Working memory buffer correctly stores and retrieves decisions"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         test_cases = [
             ("Framework principle for batch", {"is_framework_principle": True}),
             ("Working memory only content", {"is_temporary": True}),
@@ -268,8 +239,8 @@ class TestComponentIntegration:
             orchestrator.add_to_working_memory(content, decision)
 
         # Verify buffer state
-        assert len(orchestrator.memory_buffer) == 3
-        for item in orchestrator.memory_buffer:
+        assert len(orchestrator.buffered_items()) == 3
+        for item in orchestrator.buffered_items():
             assert "content" in item
             assert "decision" in item
             assert "timestamp" in item
@@ -281,10 +252,8 @@ class TestComponentIntegration:
         assert all(action == "queue_for_batch" for action in batch_actions)
 
     @pytest.mark.asyncio
-    async def test_context_propagation_through_pipeline(self):
+    async def test_context_propagation_through_pipeline(self, orchestrator):
         """Context flags propagate correctly through all components"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         context_flags = {
             "corrects_previous_error": True,
             "unexpected_result": True,
@@ -310,10 +279,8 @@ class TestComponentIntegration:
         assert decision["tier"] == MemoryTier.TIER1_PRINCIPLE
 
     @pytest.mark.asyncio
-    async def test_existing_memories_influence_decisions(self):
+    async def test_existing_memories_influence_decisions(self, orchestrator):
         """Existing memories parameter influences importance scoring"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         content = "Framework methodology for testing validation"
 
         # No existing memories - should score higher (novel)
@@ -342,138 +309,135 @@ class TestDecisionMatrixIntegration:
     """Gate 2: Integration Quality - Decision Matrix Completeness"""
 
     @pytest.mark.asyncio
-    async def test_all_tier_action_combinations(self):
+    @pytest.mark.parametrize(
+        "content, context, existing_memories, expected_tier, expected_action",
+        [
+            # Tier 0 → Always immediate_vectorize
+            (
+                "Never Fade to Black identity",
+                {"is_identity_anchor": True},
+                None,
+                MemoryTier.TIER0_ANCHOR,
+                "immediate_vectorize",
+            ),
+            # Tier 1 + high score → immediate_vectorize
+            (
+                "Important framework principle: critical validation pattern",
+                {},
+                [],
+                MemoryTier.TIER1_PRINCIPLE,
+                "immediate_vectorize",
+            ),
+            # Tier 1 + low score → queue_for_batch
+            (
+                "Framework methodology note",
+                {},
+                ["Framework methodology"] * 5,
+                MemoryTier.TIER1_PRINCIPLE,
+                "queue_for_batch",
+            ),
+            # Tier 2 + high score → queue_for_batch
+            (
+                "Important bug fix: correction for authentication flow",
+                {"corrects_previous_error": True},
+                [],
+                MemoryTier.TIER2_SOLUTION,
+                "queue_for_batch",
+            ),
+            # Tier 2 + low score → working_memory_only
+            (
+                "Bug fix deployed",
+                {},
+                ["Bug fix"] * 5,
+                MemoryTier.TIER2_SOLUTION,
+                "working_memory_only",
+            ),
+            # Tier 3 + exceptional score → queue_for_batch
+            (
+                "Working on important correction with unexpected validation failure",
+                {
+                    "corrects_previous_error": True,
+                    "unexpected_result": True,
+                    "validation_result": "failed",
+                },
+                [],
+                MemoryTier.TIER3_CONTEXT,
+                "queue_for_batch",
+            ),
+            # Tier 3 + low score → working_memory_only
+            (
+                "Working on task",
+                {"is_temporary": True},
+                [],
+                MemoryTier.TIER3_CONTEXT,
+                "working_memory_only",
+            ),
+        ],
+    )
+    async def test_all_tier_action_combinations(
+        self, orchestrator, content, context, existing_memories, expected_tier, expected_action
+    ):
         """Test all valid tier × action combinations"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
-        # Tier 0 → Always immediate_vectorize
-        t0_decision = await orchestrator.process_memory_candidate(
-            content="Never Fade to Black identity",
-            context={"is_identity_anchor": True},
-            existing_memories=None,
-        )
-        assert t0_decision["tier"] == MemoryTier.TIER0_ANCHOR
-        assert t0_decision["action"] == "immediate_vectorize"
-
-        # Tier 1 + high score → immediate_vectorize
-        t1_high = await orchestrator.process_memory_candidate(
-            content="Important framework principle: critical validation pattern",
-            context={},
-            existing_memories=[],
-        )
-        assert t1_high["tier"] == MemoryTier.TIER1_PRINCIPLE
-        assert t1_high["action"] == "immediate_vectorize"
-
-        # Tier 1 + low score → queue_for_batch
-        t1_low = await orchestrator.process_memory_candidate(
-            content="Framework methodology note",
-            context={},
-            existing_memories=["Framework methodology"] * 5,
-        )
-        assert t1_low["tier"] == MemoryTier.TIER1_PRINCIPLE
-        assert t1_low["action"] == "queue_for_batch"
-
-        # Tier 2 + high score → queue_for_batch
-        t2_high = await orchestrator.process_memory_candidate(
-            content="Important bug fix: correction for authentication flow",
-            context={"corrects_previous_error": True},
-            existing_memories=[],
-        )
-        assert t2_high["tier"] == MemoryTier.TIER2_SOLUTION
-        assert t2_high["action"] == "queue_for_batch"
-
-        # Tier 2 + low score → working_memory_only
-        t2_low = await orchestrator.process_memory_candidate(
-            content="Bug fix deployed", context={}, existing_memories=["Bug fix"] * 5
-        )
-        assert t2_low["tier"] == MemoryTier.TIER2_SOLUTION
-        assert t2_low["action"] == "working_memory_only"
-
-        # Tier 3 + exceptional score → queue_for_batch
-        t3_high = await orchestrator.process_memory_candidate(
-            content="Working on important correction with unexpected validation failure",
-            context={
-                "corrects_previous_error": True,
-                "unexpected_result": True,
-                "validation_result": "failed",
-            },
-            existing_memories=[],
-        )
-        assert t3_high["tier"] == MemoryTier.TIER3_CONTEXT
-        assert t3_high["action"] == "queue_for_batch"
-
-        # Tier 3 + low score → working_memory_only
-        t3_low = await orchestrator.process_memory_candidate(
-            content="Working on task", context={"is_temporary": True}, existing_memories=[]
+        decision = await orchestrator.process_memory_candidate(
+            content=content, context=context, existing_memories=existing_memories
         )
-        assert t3_low["tier"] == MemoryTier.TIER3_CONTEXT
-        assert t3_low["action"] == "working_memory_only"
+        assert decision["tier"] == expected_tier
+        assert decision["action"] == expected_action
 
     @pytest.mark.asyncio
-    async def test_priority_levels_assigned_correctly(self):
+    @pytest.mark.parametrize(
+        "content, context, existing_memories, expected_priority",
+        [
+            # High priority: Tier 1 immediate vectorize
+            ("Important framework methodology", {}, [], "high"),
+            # Medium priority: Batch queue items
+            ("Framework principle", {}, ["framework"] * 5, "medium"),
+        ],
+    )
+    async def test_priority_levels_assigned_correctly(
+        self, orchestrator, content, context, existing_memories, expected_priority
+    ):
         """Priority levels match tier and action combinations"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
-        # Critical priority: Tier 0 or user commanded
-        critical_t0 = await orchestrator.process_memory_candidate(
-            content="Never Fade to Black",
-            context={"is_identity_anchor": True},
-            existing_memories=None,
-        )
-        assert critical_t0["priority"] == "critical"
-
-        critical_cmd = await orchestrator.process_memory_candidate(
-            content="Remember this pattern", context={}, existing_memories=None
-        )
-        assert critical_cmd["priority"] == "critical"
-
-        # High priority: Tier 1 immediate vectorize
-        high = await orchestrator.process_memory_candidate(
-            content="Important framework methodology", context={}, existing_memories=[]
-        )
-        assert high["priority"] == "high"
-
-        # Medium priority: Batch queue items
-        medium = await orchestrator.process_memory_candidate(
-            content="Framework principle", context={}, existing_memories=["framework"] * 5
-        )
-        assert medium["priority"] == "medium"
-
-        # Low priority: Working memory only
-        low = await orchestrator.process_memory_candidate(
-            content="Working on task", context={"is_temporary": True}, existing_memories=[]
-        )
-        assert low["priority"] == "low"
+        decision = await orchestrator.process_memory_candidate(
+            content=content, context=context, existing_memories=existing_memories
+        )
+        assert decision["priority"] == expected_priority
+
+    @pytest.mark.parametrize(
+        "scenario, expected_priority",
+        [
+            # Critical priority: Tier 0 or user commanded
+            ("t0_anchor", "critical"),
+            ("user_cmd", "critical"),
+            # Low priority: Working memory only
+            ("t3_temporary", "low"),
+        ],
+    )
+    def test_canonical_priority_levels(self, canonical_decisions, scenario, expected_priority):
+        """Priority levels of the shared canonical decisions"""
+        assert canonical_decisions[scenario]["priority"] == expected_priority
 
     @pytest.mark.asyncio
-    async def test_decay_functions_assigned_correctly(self):
+    async def test_decay_functions_assigned_correctly(self, orchestrator, canonical_decisions):
         """Decay functions match memory tiers"""
-        orchestrator = AdaptiveMemoryOrchestrator()
-
         # Tier 0 → NEVER
-        t0 = await orchestrator.process_memory_candidate(
-            content="Never Fade to Black",
-            context={"is_identity_anchor": True},
-            existing_memories=None,
-        )
+        t0 = canonical_decisions["t0_anchor"]
         assert t0["decay_function"] == DecayFunction.NEVER
 
-        # Tier 1 → SUPERSEDED_ONLY
-        t1 = await orchestrator.process_memory_candidate(
-            content="Framework methodology principle", context={}, existing_memories=[]
+        # Tier 1 and Tier 2 decided in one batch call
+        t1, t2 = await orchestrator.process_memory_candidates(
+            ["Framework methodology principle", "Bug fix solution deployed"],
+            existing_memories=[],
         )
+
+        # Tier 1 → SUPERSEDED_ONLY
         assert t1["decay_function"] == DecayFunction.SUPERSEDED_ONLY
 
         # Tier 2 → STALENESS_6MONTHS
-        t2 = await orchestrator.process_memory_candidate(
-            content="Bug fix solution deployed", context={}, existing_memories=[]
-        )
         assert t2["decay_function"] == DecayFunction.STALENESS_6MONTHS
 
         # Tier 3 → RAPID (7 days or 24 hours)
-        t3 = await orchestrator.process_memory_candidate(
-            content="Working on task", context={"is_temporary": True}, existing_memories=[]
-        )
+        t3 = canonical_decisions["t3_temporary"]
         assert t3["decay_function"] in [DecayFunction.RAPID_7DAYS, DecayFunction.RAPID_24HOURS]
 
 
@@ -232,7 +232,7 @@ class TestMemoryFootprint:
         import gc
 
         gc.collect()
-        sys.getsizeof(orchestrator.memory_buffer) / (1024 * 1024)
+        sys.getsizeof(orchestrator.buffered_items()) / (1024 * 1024)
 
         # Add 1000 memories
         for i in range(1000):
@@ -243,11 +243,11 @@ class TestMemoryFootprint:
             orchestrator.add_to_working_memory(content, decision)
 
         # Measure memory usage
-        buffer_size_mb = sys.getsizeof(orchestrator.memory_buffer) / (1024 * 1024)
+        buffer_size_mb = sys.getsizeof(orchestrator.buffered_items()) / (1024 * 1024)
 
         # Estimate total size including content
         total_estimate_mb = 0
-        for item in orchestrator.memory_buffer:
+        for item in orchestrator.buffered_items():
             total_estimate_mb += sys.getsizeof(item) / (1024 * 1024)
             total_estimate_mb += sys.getsizeof(item.get("content", "")) / (1024 * 1024)
             total_estimate_mb += sys.getsizeof(item.get("decision", {})) / (1024 * 1024)
@@ -282,7 +282,7 @@ class TestMemoryFootprint:
         # Get batch queue (should not duplicate)
         batch_queue = orchestrator.get_batch_queue()
 
-        buffer_size = sys.getsizeof(orchestrator.memory_buffer) / (1024 * 1024)
+        buffer_size = sys.getsizeof(orchestrator.buffered_items()) / (1024 * 1024)
         queue_size = sys.getsizeof(batch_queue) / (1024 * 1024)
 
         print("\nMemory efficiency (500 items):")
@@ -503,10 +503,10 @@ class TestConcurrentStability:
             orchestrator.add_to_working_memory(f"Rapid memory {i}", decision)
 
         # Should not corrupt buffer
-        assert len(orchestrator.memory_buffer) == 50
+        assert len(orchestrator.buffered_items()) == 50
 
         # All items should have unique hashes
-        hashes = [item["hash"] for item in orchestrator.memory_buffer]
+        hashes = [item["hash"] for item in orchestrator.buffered_items()]
         assert len(hashes) == len(set(hashes))
 
     @pytest.mark.asyncio
@@ -554,8 +554,8 @@ class TestWorkingMemoryStability:
         orchestrator.add_to_working_memory(content, decision2)
 
         # Both should have same hash
-        hash1 = orchestrator.memory_buffer[0]["hash"]
-        hash2 = orchestrator.memory_buffer[1]["hash"]
+        hash1 = orchestrator.buffered_items()[0]["hash"]
+        hash2 = orchestrator.buffered_items()[1]["hash"]
         assert hash1 == hash2
 
     @pytest.mark.asyncio
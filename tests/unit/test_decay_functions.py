@@ -0,0 +1,94 @@
+"""
+Unit Tests for Decay Functions
+
+Tests the decay policy helpers:
+- Decay timestamp per decay function
+- Age-based decay checks
+- Non-member decay functions never decay
+- Batch decay sweep matches per-memory checks (and rejects length mismatches)
+- Epoch-nanosecond decay check matches the datetime check
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pattern_agentic_memory.core.decay_functions import (
+    DecayFunction,
+    calculate_decay_timestamp,
+    should_decay,
+    should_decay_batch,
+    should_decay_ns,
+)
+
+
+class TestDecayFunctions:
+    """Decay policy helpers"""
+
+    def test_decay_timestamp_per_function(self):
+        """Each decay function maps to its policy TTL"""
+        created = datetime(2025, 1, 1)
+
+        assert calculate_decay_timestamp(DecayFunction.NEVER, created) is None
+        assert calculate_decay_timestamp(DecayFunction.RAPID_14DAYS, created) == datetime(
+            2025, 1, 15
+        )
+
+    def test_unknown_decay_function(self):
+        """Values outside DecayFunction never decay instead of raising"""
+        created = datetime(2025, 1, 1)
+
+        assert calculate_decay_timestamp("rapid_14days", created) is None
+        assert not should_decay(created, "rapid_14days", created + timedelta(days=1000))
+
+    def test_policy_attributes(self):
+        """Members carry their DECAY_POLICY_MAP policy"""
+        assert DecayFunction.NEVER.delta is None
+        assert DecayFunction.RAPID_14DAYS.delta == timedelta(days=14)
+        assert DecayFunction.RAPID_14DAYS.delta_ns == 14 * 86400 * 10**9
+        assert DecayFunction.SUPERSEDED_ONLY.delta_ns is None
+        assert len(DecayFunction) == 4
+
+    def test_should_decay_boundary(self):
+        """Memory decays exactly when its age reaches the TTL"""
+        created = datetime(2025, 1, 1)
+
+        assert not should_decay(created, DecayFunction.RAPID_14DAYS, created + timedelta(days=13))
+        assert should_decay(created, DecayFunction.RAPID_14DAYS, created + timedelta(days=14))
+        assert not should_decay(
+            created, DecayFunction.SUPERSEDED_ONLY, created + timedelta(days=1000)
+        )
+
+    def test_should_decay_batch_matches_single(self):
+        """Batch sweep gives the same answer as should_decay per memory"""
+        now = datetime(2025, 6, 1)
+        timestamps = [now - timedelta(days=days) for days in (0, 13, 14, 15, 29, 30, 400)]
+
+        for decay_function in DecayFunction:
+            functions = [decay_function] * len(timestamps)
+            expected = [should_decay(ts, decay_function, now) for ts in timestamps]
+
+            assert should_decay_batch(timestamps, functions, now) == expected
+
+    def test_should_decay_batch_length_mismatch(self):
+        """Timestamps and decay functions must pair up one to one"""
+        now = datetime(2025, 6, 1)
+
+        with pytest.raises(ValueError):
+            should_decay_batch([now, now, now], [DecayFunction.RAPID_14DAYS], now)
+        with pytest.raises(ValueError):
+            should_decay_batch([now], [DecayFunction.NEVER] * 2, now)
+
+    def test_should_decay_ns_matches_datetime(self):
+        """Integer nanosecond check agrees with should_decay"""
+        now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        now_ns = int(now.timestamp()) * 10**9
+
+        for days in (0, 13, 14, 15, 29, 30, 400):
+            created = now - timedelta(days=days)
+            created_ns = int(created.timestamp()) * 10**9
+
+            for decay_function in DecayFunction:
+                assert should_decay_ns(created_ns, decay_function, now_ns) == should_decay(
+                    created, decay_function, now
+                )
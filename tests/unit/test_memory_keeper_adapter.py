@@ -0,0 +1,345 @@
+"""
+Unit Tests for Memory Keeper Adapter
+
+Runs the adapter against an in-memory fake of the Memory Keeper MCP tools:
+- Batch flush: hash dedup, bounded concurrency, failure and retry
+- Access flush: serialized flushes, timer flush, failure and retry, shutdown drain
+- Access tracking: coalesced counts, flush threshold, background drain
+- update_access_tracking(): TTL bonus, access EMA, next_prompt_at, cooldown and
+  frequency gate
+"""
+
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from pattern_agentic_memory.adapters.memory_keeper import MemoryKeeperAdapter
+from pattern_agentic_memory.core.tier_promotion import (
+    access_rate_reached,
+    calculate_expiration_with_bonus,
+    prompt_cooldown_elapsed,
+    should_trigger_promotion_prompt,
+    update_access_ema,
+)
+from pattern_agentic_memory.utils.hashing import content_hash
+
+BATCH_DECISION = {
+    "action": "queue_for_batch",
+    "tier": "solution",
+    "decay_function": "staleness_6months",
+    "reasoning": "test",
+    "priority": "medium",
+}
+
+
+class FakeMemoryKeeper:
+    """In-memory stand-in for the Memory Keeper context_get/context_save tools"""
+
+    def __init__(self):
+        self.items = {}
+        self.saves = []
+        self.fail_keys = set()
+        self.latency = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def context_get(self, key=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        item = self.items.get(key)
+        return {"items": [dict(item)] if item else []}
+
+    async def context_save(self, key, value, category, priority):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if key in self.fail_keys:
+                raise ConnectionError(f"save failed: {key}")
+            self.items[key] = {
+                "key": key,
+                "value": value,
+                "category": category,
+                "priority": priority,
+            }
+            self.saves.append(key)
+        finally:
+            self.in_flight -= 1
+
+    def metadata(self, key):
+        return json.loads(self.items[key]["value"])["metadata"]
+
+
+@pytest.fixture
+def keeper():
+    return FakeMemoryKeeper()
+
+
+@pytest.fixture
+def adapter(keeper):
+    adapter = MemoryKeeperAdapter(flush_concurrency=4, access_flush_interval=0.01)
+    adapter._context_get = keeper.context_get
+    adapter._context_save = keeper.context_save
+    return adapter
+
+
+def queue(adapter, *contents):
+    for content in contents:
+        adapter.orchestrator.add_to_working_memory(content, BATCH_DECISION)
+
+
+async def saved(adapter, content):
+    return await adapter._save_to_memory_keeper(content, BATCH_DECISION)
+
+
+def key_of(content):
+    return f"adaptive_memory_{content_hash(content)}"
+
+
+class TestBatchFlush:
+    """flush_batch_queue()"""
+
+    async def test_duplicates_saved_once(self, adapter, keeper):
+        """Identical queued content is one Memory Keeper key, saved once"""
+        queue(adapter, "alpha", "beta", "alpha")
+
+        assert await adapter.flush_batch_queue() == 3
+        assert sorted(keeper.saves) == sorted({key_of("alpha"), key_of("beta")})
+        assert adapter.orchestrator.batch_queue_size == 0
+
+    async def test_saves_bounded(self, adapter, keeper):
+        """No more than flush_concurrency saves are in flight"""
+        queue(adapter, *(f"memory {i}" for i in range(20)))
+
+        assert await adapter.flush_batch_queue() == 20
+        assert len(keeper.saves) == 20
+        assert keeper.max_in_flight == adapter.flush_concurrency
+
+    async def test_failed_saves_requeued(self, adapter, keeper):
+        """Failed items go back to the front of the queue and the error is raised"""
+        queue(adapter, "alpha", "beta", "alpha", "gamma")
+        keeper.fail_keys.add(key_of("alpha"))
+
+        with pytest.raises(ConnectionError):
+            await adapter.flush_batch_queue()
+
+        assert sorted(keeper.saves) == sorted({key_of("beta"), key_of("gamma")})
+        assert [i["content"] for i in adapter.orchestrator.batch_buffer] == ["alpha", "alpha"]
+
+        # Memories queued after the failure stay behind the requeued ones
+        queue(adapter, "delta")
+        assert [i["content"] for i in adapter.orchestrator.batch_buffer] == [
+            "alpha",
+            "alpha",
+            "delta",
+        ]
+
+        keeper.fail_keys.clear()
+        assert await adapter.flush_batch_queue() == 3
+        assert key_of("alpha") in keeper.items
+        assert adapter.orchestrator.batch_queue_size == 0
+
+    async def test_tracking_failure_does_not_block_saves(self, adapter, keeper):
+        """A failing access update is logged and kept; the batch is still saved"""
+        key = await saved(adapter, "alpha")
+        keeper.fail_keys.add(key)
+        await adapter.context_get_with_tracking(key)
+        queue(adapter, "beta")
+
+        assert await adapter.flush_batch_queue() == 1
+        assert key_of("beta") in keeper.items
+        assert adapter._access_deltas[key][0] == 1
+
+
+class TestAccessFlush:
+    """flush_access_deltas() and its triggers"""
+
+    async def test_concurrent_flushes(self, adapter, keeper):
+        """Overlapping flushes of the same memory don't lose accesses"""
+        key = await saved(adapter, "alpha")
+        keeper.latency = 0.005
+
+        await adapter.context_get_with_tracking(key)
+        first = asyncio.ensure_future(adapter.flush_access_deltas())
+        await asyncio.sleep(0)
+        # Second read lands while the first flush is between its get and save
+        adapter._record_accesses([key], None)
+        await asyncio.gather(first, adapter.flush_access_deltas())
+
+        assert keeper.metadata(key)["access_count"] == 2
+
+    async def test_timer_flush(self, adapter, keeper):
+        """Buffered accesses below the threshold are written after the interval"""
+        key = await saved(adapter, "alpha")
+
+        await adapter.context_get_with_tracking(key)
+        assert keeper.metadata(key)["access_count"] == 0
+
+        await asyncio.sleep(adapter.access_flush_interval * 5)
+        await adapter.drain_access_tracking()
+        assert keeper.metadata(key)["access_count"] == 1
+        assert adapter._access_flush_timer is None
+
+    async def test_failed_deltas_merged_back(self, adapter, keeper):
+        """A failed update keeps its accesses buffered for the next flush"""
+        key = await saved(adapter, "alpha")
+        keeper.fail_keys.add(key)
+
+        await adapter.context_get_with_tracking(key)
+        await adapter.context_get_with_tracking(key)
+        with pytest.raises(ConnectionError):
+            await adapter.flush_access_deltas()
+        assert adapter._access_deltas[key][0] == 2
+        assert adapter._access_flush_timer is not None
+
+        # Reads recorded after the failure add to the requeued delta
+        await adapter.context_get_with_tracking(key)
+        keeper.fail_keys.clear()
+        assert await adapter.flush_access_deltas() == 1
+        assert keeper.metadata(key)["access_count"] == 3
+        assert adapter._access_deltas == {}
+
+    async def test_aclose(self, adapter, keeper):
+        """Shutdown writes buffered accesses and queued memories"""
+        key = await saved(adapter, "alpha")
+        await adapter.context_get_with_tracking(key)
+        queue(adapter, "beta")
+
+        await adapter.aclose()
+
+        assert keeper.metadata(key)["access_count"] == 1
+        assert key_of("beta") in keeper.items
+        assert adapter._access_flush_timer is None
+        assert adapter.orchestrator.batch_queue_size == 0
+
+
+class TestAccessTracking:
+    """Coalesced access tracking and update_access_tracking()"""
+
+    async def test_coalesced_counts(self, adapter, keeper):
+        """Repeated reads of a memory become one update with the summed count"""
+        alpha = await saved(adapter, "alpha")
+        beta = await saved(adapter, "beta")
+        saves = len(keeper.saves)
+
+        for key in (alpha, alpha, beta, alpha):
+            await adapter.context_get_with_tracking(key, agent_id="agent-a")
+        assert {key: delta[0] for key, delta in adapter._access_deltas.items()} == {
+            alpha: 3,
+            beta: 1,
+        }
+        assert len(keeper.saves) == saves
+
+        assert await adapter.flush_access_deltas() == 2
+        assert len(keeper.saves) == saves + 2
+        assert keeper.metadata(alpha)["access_count"] == 3
+        assert keeper.metadata(beta)["access_count"] == 1
+
+    async def test_flush_threshold(self, adapter, keeper):
+        """Reaching the threshold flushes in the background; drain waits for it"""
+        adapter.access_flush_threshold = 2
+        alpha = await saved(adapter, "alpha")
+        beta = await saved(adapter, "beta")
+
+        await adapter.context_get_with_tracking(alpha)
+        assert not adapter._tracking_tasks
+        await adapter.context_get_with_tracking(beta)
+        assert len(adapter._tracking_tasks) == 1
+
+        await adapter.drain_access_tracking()
+        assert not adapter._tracking_tasks
+        assert keeper.metadata(alpha)["access_count"] == 1
+        assert keeper.metadata(beta)["access_count"] == 1
+
+    async def test_missing_memory_reads_untracked(self, adapter, keeper):
+        """Reads of keys Memory Keeper doesn't have are not buffered"""
+        await adapter.context_get_with_tracking("adaptive_memory_missing")
+        assert adapter._access_deltas == {}
+
+    async def test_update_fields(self, adapter, keeper):
+        """An update sets count, last access, TTL bonus and access EMA"""
+        key = await saved(adapter, "alpha")
+        created_at = datetime.fromisoformat(keeper.metadata(key)["timestamp"])
+        accessed_at = created_at + timedelta(days=2)
+
+        result = await adapter.update_access_tracking(key, access_delta=3, accessed_at=accessed_at)
+
+        metadata = keeper.metadata(key)
+        assert result["access_count"] == metadata["access_count"] == 3
+        assert metadata["last_accessed"] == accessed_at.isoformat()
+        assert metadata["expires_at"] == (
+            calculate_expiration_with_bonus("solution", 3, created_at).isoformat()
+        )
+        assert metadata["access_ema"] == pytest.approx(update_access_ema(0.0, 3, 2.0))
+        assert metadata["next_prompt_at"] == 7
+        assert not result["promotion_prompt_triggered"]
+
+    async def test_prompt_thresholds(self, adapter, keeper, capsys):
+        """Deltas crossing a multiple of 7 prompt once, outside the cooldown"""
+        key = await saved(adapter, "alpha")
+        start = datetime.fromisoformat(keeper.metadata(key)["timestamp"])
+
+        async def access(delta, days):
+            result = await adapter.update_access_tracking(
+                key, access_delta=delta, accessed_at=start + timedelta(days=days)
+            )
+            return result["promotion_prompt_triggered"], keeper.metadata(key)["next_prompt_at"]
+
+        assert await access(9, 1) == (True, 14)  # 0 -> 9 crosses 7
+        assert "TIER PROMOTION" in capsys.readouterr().out
+        assert await access(3, 2) == (False, 14)  # 9 -> 12
+        assert await access(2, 3) == (False, 21)  # 14 reached inside the cooldown
+        assert await access(16, 9) == (True, 35)  # 14 -> 30 crosses 21 and 28
+        assert keeper.metadata(key)["last_prompt_at"] == (start + timedelta(days=9)).isoformat()
+
+    async def test_rarely_accessed_not_prompted(self, adapter, keeper):
+        """Reaching 7 accesses at ten days apart stays below the target hit rate"""
+        key = await saved(adapter, "alpha")
+        start = datetime.fromisoformat(keeper.metadata(key)["timestamp"])
+
+        for day in range(10, 80, 10):
+            result = await adapter.update_access_tracking(
+                key, accessed_at=start + timedelta(days=day)
+            )
+        assert result["access_count"] == 7
+        assert not result["promotion_prompt_triggered"]
+        assert keeper.metadata(key)["next_prompt_at"] == 14
+
+    async def test_prompt_threshold_derived_for_old_memories(self, adapter, keeper):
+        """Memories saved without next_prompt_at derive it from their count"""
+        key = await saved(adapter, "alpha")
+        value = json.loads(keeper.items[key]["value"])
+        value["metadata"]["access_count"] = 12
+        del value["metadata"]["next_prompt_at"]
+        keeper.items[key]["value"] = json.dumps(value)
+
+        result = await adapter.update_access_tracking(key, access_delta=2)
+        assert result["promotion_prompt_triggered"]
+        assert keeper.metadata(key)["next_prompt_at"] == 21
+
+    async def test_prompts_match_per_access_check(self, adapter, keeper):
+        """Coalesced deltas prompt exactly when per-access checks would"""
+        rng = random.Random(7)
+        key = await saved(adapter, "alpha")
+        now = datetime.fromisoformat(keeper.metadata(key)["timestamp"])
+        count, last_prompt_at = 0, None
+
+        for _ in range(200):
+            delta = rng.randint(1, 20)
+            now += timedelta(hours=rng.randint(1, 2400))
+            result = await adapter.update_access_tracking(key, access_delta=delta, accessed_at=now)
+
+            crossed = any(
+                should_trigger_promotion_prompt(c) for c in range(count + 1, count + delta + 1)
+            )
+            expected = (
+                crossed
+                and access_rate_reached(result["access_ema"])
+                and prompt_cooldown_elapsed(last_prompt_at, now)
+            )
+            assert result["promotion_prompt_triggered"] == expected
+            count += delta
+            if expected:
+                last_prompt_at = now
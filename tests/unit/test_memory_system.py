@@ -167,11 +167,31 @@ class TestAdaptiveMemoryOrchestrator:
 
         orchestrator.add_to_working_memory(content, decision)
 
-        assert len(orchestrator.memory_buffer) == 1
-        assert orchestrator.memory_buffer[0]["content"] == content
-        assert orchestrator.memory_buffer[0]["decision"] == decision
-        assert "timestamp" in orchestrator.memory_buffer[0]
-        assert "hash" in orchestrator.memory_buffer[0]
+        assert len(orchestrator.buffered_items()) == 1
+        assert orchestrator.buffered_items()[0]["content"] == content
+        assert orchestrator.buffered_items()[0]["decision"] == decision
+        assert "timestamp" in orchestrator.buffered_items()[0]
+        assert "hash" in orchestrator.buffered_items()[0]
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_buffers(self):
+        """reset() empties working memory and the batch queue"""
+        orchestrator = AdaptiveMemoryOrchestrator()
+
+        for content, context in (
+            ("Framework principle for batch", {"is_framework_principle": True}),
+            ("Working memory only content", {"is_temporary": True}),
+        ):
+            decision = await orchestrator.process_memory_candidate(
+                content=content, context=context, existing_memories=[]
+            )
+            orchestrator.add_to_working_memory(content, decision)
+        assert orchestrator.buffer_size == 2
+
+        orchestrator.reset()
+
+        assert orchestrator.buffer_size == 0
+        assert orchestrator.get_batch_queue() == []
 
     @pytest.mark.asyncio
     async def test_batch_queue_retrieval(self):
@@ -197,3 +217,60 @@ class TestAdaptiveMemoryOrchestrator:
 
         # Only queued memories should be in batch queue
         assert all(m["decision"]["action"] == "queue_for_batch" for m in batch_queue)
+
+    @pytest.mark.asyncio
+    async def test_sync_entry_point_matches_async(self):
+        """process_memory_candidate_sync returns the same decision without awaiting"""
+        orchestrator = AdaptiveMemoryOrchestrator()
+        content = "Oracle Framework principle: validation protocol for every agent"
+
+        decision = orchestrator.process_memory_candidate_sync(
+            content=content, context={}, existing_memories=None
+        )
+
+        assert decision == await orchestrator.process_memory_candidate(
+            content=content, context={}, existing_memories=None
+        )
+        assert decision["tier"] == MemoryTier.TIER1_PRINCIPLE
+
+    @pytest.mark.asyncio
+    async def test_batch_processing_matches_single(self):
+        """process_memory_candidates decides each candidate like the single entry point"""
+        orchestrator = AdaptiveMemoryOrchestrator()
+        contents = [
+            "Never Fade to Black partnership identity",
+            "Working on the frontend CSS bug",
+            "Remember this: Always use service_manager.sh",
+        ]
+        contexts = [{"is_identity_anchor": True}, {}, {}]
+
+        decisions = await orchestrator.process_memory_candidates(contents, contexts)
+
+        assert decisions == [
+            orchestrator.process_memory_candidate_sync(content, context)
+            for content, context in zip(contents, contexts)
+        ]
+        assert decisions[0]["tier"] == MemoryTier.TIER0_ANCHOR
+        assert decisions[1]["tier"] == MemoryTier.TIER3_CONTEXT
+        assert decisions[2].get("user_commanded") is True
+
+        with pytest.raises(ValueError):
+            await orchestrator.process_memory_candidates(contents, contexts[:1])
+
+    def test_take_batch_queue_leaves_working_memory(self):
+        """Taking the batch queue empties it without touching working memory"""
+        orchestrator = AdaptiveMemoryOrchestrator()
+
+        orchestrator.add_to_working_memory("queued 1", {"action": "queue_for_batch"})
+        orchestrator.add_to_working_memory("working", {"action": "working_memory_only"})
+        orchestrator.add_to_working_memory("queued 2", {"action": "queue_for_batch"})
+
+        assert orchestrator.batch_queue_size == 2
+        assert orchestrator.buffer_size == 3
+
+        taken = orchestrator.take_batch_queue()
+
+        assert [m["content"] for m in taken] == ["queued 1", "queued 2"]
+        assert orchestrator.batch_queue_size == 0
+        assert orchestrator.buffer_size == 1
+        assert orchestrator.buffered_items()[0]["content"] == "working"
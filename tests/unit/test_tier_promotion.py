@@ -0,0 +1,123 @@
+"""
+Unit Tests for Tier Promotion
+
+Tests the promotion prompt policy helpers:
+- Prompts at multiples of 7 accesses
+- Prompt cooldown after a previous prompt
+- Access-frequency gate on prompts
+- Access-frequency EMA updates
+- Batched notification output
+- Disabled notifications
+- Frozen clock
+- Promotion results
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from pattern_agentic_memory.core import tier_promotion
+from pattern_agentic_memory.core.tier_promotion import (
+    ACCESS_EMA_ALPHA,
+    PROMPT_COOLDOWN,
+    PROMPT_TARGET_HIT_RATE,
+    PromotionResult,
+    batched_notifications,
+    calculate_expiration_with_bonus,
+    frozen_now,
+    next_prompt_threshold,
+    notify_agent,
+    notify_user,
+    promote_memory_tier,
+    should_trigger_promotion_prompt,
+    trigger_tier_promotion_prompt,
+    update_access_ema,
+)
+
+
+class TestTierPromotion:
+    """Promotion prompt policy"""
+
+    def test_prompt_at_multiples_of_seven(self):
+        """Without a previous prompt, every 7th access triggers"""
+        assert [c for c in range(0, 22) if should_trigger_promotion_prompt(c)] == [7, 14, 21]
+
+    def test_next_prompt_threshold(self):
+        """The stored threshold is the next multiple of 7 above the access count"""
+        assert [next_prompt_threshold(c) for c in (0, 6, 7, 13, 14)] == [7, 7, 14, 14, 21]
+        assert all(should_trigger_promotion_prompt(next_prompt_threshold(c)) for c in range(0, 50))
+
+    def test_prompt_cooldown(self):
+        """A prompt within the cooldown window of the previous one is suppressed"""
+        now = datetime(2025, 6, 1)
+
+        assert not should_trigger_promotion_prompt(14, now - timedelta(days=1), now)
+        assert should_trigger_promotion_prompt(14, now - PROMPT_COOLDOWN, now)
+        assert not should_trigger_promotion_prompt(15, now - PROMPT_COOLDOWN, now)
+
+    def test_prompt_frequency_gate(self):
+        """With a known access EMA, rarely accessed memories are not prompted"""
+        assert should_trigger_promotion_prompt(7, access_ema=PROMPT_TARGET_HIT_RATE)
+        assert not should_trigger_promotion_prompt(7, access_ema=PROMPT_TARGET_HIT_RATE / 2)
+        assert not should_trigger_promotion_prompt(8, access_ema=PROMPT_TARGET_HIT_RATE * 4)
+
+    def test_access_ema(self):
+        """EMA moves toward the observed access rate"""
+        ema = update_access_ema(0.0, access_delta=1, interval_days=1.0)
+        assert ema == pytest.approx(ACCESS_EMA_ALPHA)
+
+        # Bursts are clamped to one access per hour
+        burst = update_access_ema(0.0, access_delta=1, interval_days=0.0)
+        assert burst == pytest.approx(ACCESS_EMA_ALPHA * 24)
+
+    def test_batched_notifications(self, capsys):
+        """Batched prompts produce the same console output, written on exit"""
+        notify_user("prompt one")
+        notify_agent("prompt one", "agent-a")
+        unbatched = capsys.readouterr().out
+
+        with batched_notifications():
+            notify_user("prompt one")
+            with batched_notifications():
+                notify_agent("prompt one", "agent-a")
+            assert capsys.readouterr().out == ""
+
+        assert capsys.readouterr().out == unbatched
+
+    def test_promote_memory_tier(self):
+        """Promotion instructions always reset the access count"""
+        result = promote_memory_tier("mem-1", "principle", promoted_by="agent")
+
+        assert isinstance(result, PromotionResult)
+        assert result.status == "promotion_requested"
+        assert (result.memory_key, result.new_tier, result.promoted_by) == (
+            "mem-1",
+            "principle",
+            "agent",
+        )
+        assert result.reset_access_count
+        assert datetime.fromisoformat(result.timestamp).microsecond == 0
+
+    def test_notifications_disabled(self, monkeypatch, capsys):
+        """Disabled notifications skip the prompt and print nothing"""
+        monkeypatch.setattr(tier_promotion, "NOTIFICATIONS_ENABLED", False)
+        created = datetime(2025, 6, 1)
+
+        prompt = trigger_tier_promotion_prompt(
+            "mem-1", "content", "context", 7, created, created, agent_id="agent-a"
+        )
+
+        assert prompt == ""
+        assert capsys.readouterr().out == ""
+
+    def test_frozen_now(self):
+        """Calls inside frozen_now() share the pinned time"""
+        pinned = datetime(2025, 6, 1, 12, 30, 45, 123456)
+
+        with frozen_now(pinned) as now:
+            assert now == pinned
+            assert calculate_expiration_with_bonus("context", 0) == pinned + timedelta(days=14)
+            assert promote_memory_tier("mem-1", "anchor").timestamp == "2025-06-01T12:30:45"
+            assert not should_trigger_promotion_prompt(7, pinned - timedelta(days=1))
+
+        assert promote_memory_tier("mem-1", "anchor").timestamp != "2025-06-01T12:30:45"
@@ -0,0 +1,176 @@
+"""
+Unit Tests for the Mr. AI Evidence Validator
+
+Pins pass/fail of .mr_ai/validation/validate_evidence.py on fixture evidence:
+- Complete evidence passes
+- Forbidden phrases (success theater), each counted once
+- Minimum command examples ($ or # at least 3 times)
+- Minimum RAW OUTPUT length (stripped)
+- Localhost-only validation and the cached config
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("yaml")
+
+# Add the validator to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / ".mr_ai" / "validation"))
+
+from validate_evidence import EvidenceValidator  # noqa: E402
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "evidence"
+
+# Required patterns and external validation without any RAW OUTPUT section
+HEADER = (
+    "EVIDENCE[Test-2024-01-01-12:00]:\n"
+    "├── Test 1: [PASS]\n"
+    "├── External: [curl http://example.com result]\n"
+    "└── Stability: [3/3 successful]\n\n"
+)
+
+
+@pytest.fixture
+def validator(tmp_path):
+    return EvidenceValidator(config_path=str(tmp_path / "missing.yaml"))
+
+
+def write_evidence(tmp_path, content, name="evidence.md"):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+class TestFixtureEvidence:
+    """Evidence files from tests/fixtures/evidence"""
+
+    def test_valid(self, validator):
+        is_valid, report = validator.validate_file(str(FIXTURES / "valid.md"))
+
+        assert is_valid and report["valid"]
+        assert report["score"] == 100
+        assert report["errors"] == [] and report["warnings"] == []
+
+    def test_success_theater(self, validator):
+        """Each forbidden phrase is one error, whatever its case or repeat count"""
+        is_valid, report = validator.validate_file(str(FIXTURES / "success_theater.md"))
+
+        assert not is_valid
+        assert report["errors"] == [
+            "Success theater detected: 'should be working'",
+            "Success theater detected: 'looks correct'",
+        ]
+        assert report["score"] == 50
+
+    def test_summarized(self, validator):
+        is_valid, report = validator.validate_file(str(FIXTURES / "summarized.md"))
+
+        assert not is_valid
+        assert report["errors"] == ["Raw output too short - likely summarized"]
+        assert report["warnings"] == ["Insufficient command examples"]
+        assert report["score"] == 60
+
+    def test_unreadable_file(self, validator, tmp_path):
+        is_valid, report = validator.validate_file(str(tmp_path / "missing.md"))
+
+        assert not is_valid
+        assert report["errors"][0].startswith("Failed to read file")
+
+
+class TestEvidenceChecks:
+    """Individual checks at their thresholds"""
+
+    @pytest.mark.parametrize("phrase", EvidenceValidator.FORBIDDEN_PHRASES)
+    def test_forbidden_phrase(self, validator, tmp_path, phrase):
+        valid = (FIXTURES / "valid.md").read_text(encoding="utf-8")
+        path = write_evidence(tmp_path, valid + f"\nNote: {phrase.upper()}.\n")
+
+        is_valid, report = validator.validate_file(path)
+        assert not is_valid
+        assert report["errors"] == [f"Success theater detected: '{phrase}'"]
+        assert report["score"] == 75
+
+    @pytest.mark.parametrize(
+        "commands, warned",
+        [
+            ("$ a\n$ b\n", True),
+            ("$ a\n$ b\n$ c\n", False),
+            ("# a\n# b\n", True),
+            ("# a\n# b\n# c\n", False),
+        ],
+    )
+    def test_command_examples(self, validator, tmp_path, commands, warned):
+        path = write_evidence(tmp_path, HEADER + commands + "RAW OUTPUT:\n" + "x" * 100)
+
+        is_valid, report = validator.validate_file(path)
+        assert is_valid
+        assert report["warnings"] == (["Insufficient command examples"] if warned else [])
+        assert report["score"] == (90 if warned else 100)
+
+    @pytest.mark.parametrize("length, too_short", [(99, True), (100, False)])
+    def test_raw_output_length(self, validator, tmp_path, length, too_short):
+        """Surrounding whitespace doesn't count toward the RAW OUTPUT length"""
+        raw = "\n \t\n" + "x" * length + " \n\n\t"
+        path = write_evidence(tmp_path, HEADER + "$ a\n$ b\n$ c\nRAW OUTPUT:" + raw)
+
+        is_valid, report = validator.validate_file(path)
+        assert is_valid is not too_short
+        assert report["errors"] == (
+            ["Raw output too short - likely summarized"] if too_short else []
+        )
+
+    def test_missing_raw_output(self, validator):
+        is_valid, report = validator.validate_content(HEADER + "$ a\n$ b\n$ c\n")
+
+        assert not is_valid
+        assert report["errors"] == ["Missing required: raw_output", "No RAW OUTPUT section found"]
+        assert report["score"] == 40
+
+    def test_utf8_decoding(self, validator, tmp_path):
+        """Box-drawing test result lines survive the bytes read"""
+        valid = (FIXTURES / "valid.md").read_text(encoding="utf-8")
+        path = write_evidence(tmp_path, valid.replace("├──", "+--"))
+
+        _, report = validator.validate_file(path)
+        assert report["errors"] == ["Missing required: test_results"]
+
+
+class TestConfig:
+    """Localhost-only validation and config loading"""
+
+    LOCAL = HEADER.replace("http://example.com", "http://localhost:8000") + (
+        "$ a\n$ b\n$ c\nRAW OUTPUT:\n" + "x" * 100
+    )
+
+    def test_localhost_only_rejected(self, validator):
+        is_valid, report = validator.validate_content(self.LOCAL)
+
+        assert not is_valid
+        assert report["errors"] == ["Only localhost testing - no external validation"]
+
+    def test_localhost_allowed_by_config(self, tmp_path):
+        config = tmp_path / "config.yaml"
+        config.write_text("validation:\n  allow_localhost_only: true\n")
+
+        is_valid, report = EvidenceValidator(config_path=str(config)).validate_content(self.LOCAL)
+        assert is_valid
+        assert report["config_loaded"]
+
+    def test_config_cached_until_changed(self, tmp_path):
+        config = tmp_path / "config.yaml"
+        config.write_text("validation:\n  allow_localhost_only: false\n")
+
+        first = EvidenceValidator(config_path=str(config)).config
+        assert EvidenceValidator(config_path=str(config)).config is first
+
+        config.write_text("validation:\n  allow_localhost_only: true\n")
+        os.utime(config, (0, 0))
+        reloaded = EvidenceValidator(config_path=str(config)).config
+        assert reloaded == {"validation": {"allow_localhost_only": True}}
+
+    def test_missing_config(self, validator):
+        assert validator.config == {}
+        assert not validator.get_report()["config_loaded"]
@@ -0,0 +1,151 @@
+"""
+Unit Tests for Vector Cleanup
+
+Tests scripts/vector_cleanup_activity_based.py:
+- compute_decay_mask(): Tier 0 never decays, TTL boundary (active age == ttl
+  kept, ttl + 1 deleted), memories created before the first active day
+- Audit log: one NDJSON line per deletion, bounded in-memory tail, flushed
+  when a run fails
+"""
+
+import json
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import vector_cleanup_activity_based  # noqa: E402
+from vector_cleanup_activity_based import (  # noqa: E402
+    TIER_TTL_DAYS,
+    VectorCleanupService,
+    compute_decay_mask,
+)
+
+START = date(2025, 1, 1).toordinal()
+
+
+def active_days(count, start=START, every=1):
+    """Ascending date ordinals of `count` active days, `every` calendar days apart"""
+    return [start + i * every for i in range(count)]
+
+
+class TestComputeDecayMask:
+    """compute_decay_mask()"""
+
+    def test_anchor_never_decays(self):
+        """Tier 0 is skipped however old it is"""
+        days = active_days(1000)
+        assert compute_decay_mask([START], ["anchor"], days) == []
+
+    def test_ttl_boundary(self):
+        """Active age equal to the TTL is kept; one more active day deletes"""
+        ttl = TIER_TTL_DAYS["context"]
+        days = active_days(ttl + 1)
+
+        # Created on day 1 -> active age ttl; created on day 0 -> ttl + 1
+        mask = compute_decay_mask([days[1], days[0]], ["context", "context"], days)
+        assert mask == [(1, ttl, ttl + 1)]
+
+    def test_idle_days_not_counted(self):
+        """Only active days count, not calendar days"""
+        ttl = TIER_TTL_DAYS["solution"]
+        days = active_days(ttl, every=7)  # ~7 months of calendar time, ttl active days
+
+        assert compute_decay_mask([START], ["solution"], days) == []
+
+    def test_created_before_first_active_day(self):
+        """A memory older than the activity history counts every active day"""
+        ttl = TIER_TTL_DAYS["context"]
+        days = active_days(ttl + 1, start=START + 100)
+
+        mask = compute_decay_mask([START], ["context"], days)
+        assert mask == [(0, ttl, ttl + 1)]
+
+    def test_mixed_tiers(self):
+        """Each memory is measured against its own tier TTL, in column order"""
+        days = active_days(200)
+        created = [days[0], days[0], days[0], days[0], days[199], START - 5]
+        tiers = ["anchor", "principle", "solution", "context", "context", "unknown"]
+
+        mask = compute_decay_mask(created, tiers, days)
+        assert mask == [
+            (1, TIER_TTL_DAYS["principle"], 200),
+            (2, TIER_TTL_DAYS["solution"], 200),
+            (3, TIER_TTL_DAYS["context"], 200),
+        ]
+
+
+def agent_entries(days):
+    """Memory Keeper entries for one agent: a vectorized context memory per day"""
+    start = datetime(2025, 1, 1, 12)
+    metadata = {"action": "immediate_vectorize", "tier": "context"}
+    return {
+        "items": [
+            {
+                "key": f"memory_{day}",
+                "created_at": (start + timedelta(days=day)).isoformat(),
+                "value": json.dumps({"content": f"memory {day}", "metadata": metadata}),
+            }
+            for day in range(days)
+        ]
+    }
+
+
+async def fake_context_get(channel, limit):
+    # 20 active days: memories 0..5 are older than the 14-day context TTL
+    return agent_entries(20)
+
+
+class TestAuditLog:
+    """Streamed NDJSON audit log"""
+
+    async def test_one_line_per_deletion(self, tmp_path):
+        audit_path = tmp_path / "audit.ndjson"
+        service = VectorCleanupService(audit_path=str(audit_path), audit_tail=4)
+        service._context_get = fake_context_get
+
+        result = await service.cleanup_agent_vectors("agent-a")
+        service.save_audit_log()
+
+        lines = [json.loads(line) for line in audit_path.read_text().splitlines()]
+        assert result["deleted"] == 6
+        assert [r["memory_id"] for r in lines] == [f"memory_{day}" for day in range(6)]
+        assert lines == result["deletions"]
+
+        # Only the most recent audit_tail records stay in memory
+        assert list(service.audit_log) == lines[-4:]
+
+    async def test_flushed_when_run_fails(self, tmp_path, monkeypatch):
+        """main() writes the records of deletions made before an error"""
+        audit_path = tmp_path / "audit.ndjson"
+        calls = []
+        services = []
+
+        async def flaky_delete(self, memory_id, agent_id):
+            services.append(self)
+            calls.append(memory_id)
+            if len(calls) == 3:
+                raise ConnectionError("vector store unavailable")
+            return True
+
+        monkeypatch.setattr(
+            vector_cleanup_activity_based,
+            "_import_mcp_tool",
+            lambda module_name, tool_name: fake_context_get,
+        )
+        monkeypatch.setattr(VectorCleanupService, "delete_vector", flaky_delete)
+        monkeypatch.setattr(
+            sys, "argv", ["vector_cleanup", "--agent", "agent-a", "--output", str(audit_path)]
+        )
+
+        with pytest.raises(ConnectionError):
+            await vector_cleanup_activity_based.main()
+
+        # Closed by main(), not left to garbage collection
+        assert services[0]._audit_file is None
+        lines = audit_path.read_text().splitlines()
+        assert [json.loads(line)["memory_id"] for line in lines] == ["memory_0", "memory_1"]